@@ -16,9 +16,18 @@ from pathlib import Path
 load_dotenv(Path(__file__).resolve().parent / ".env")
 
 import json
+import os
 import sys
 import argparse
-from pathlib import Path
+from collections import defaultdict
+from functools import lru_cache
+from operator import attrgetter
+from typing import NoReturn
+
+try:
+    import orjson  # Optional: faster JSON encoding for CLI output
+except ImportError:
+    orjson = None
 
 # Configure logging and config (one-time at startup)
 from utils.logger import Logger, get_logger
@@ -26,23 +35,13 @@ from utils.config import Config
 
 # Import core analysis modules
 from core.ast_parser import SafeParser
-from core.models import EntityType
-from core.project_analyzer import analyze_project, analyze_project_with_semantic
+from core.models import EntityType, Function, Class, Import
+from core.project_analyzer import ProjectAnalyzer, analyze_project, analyze_project_with_semantic
 from core.semantic_index import SemanticIndexer
 from core.semantic_query import query_semantic_index
 
-# Import RAG modules (lazy loading to avoid dependency issues)
-def _import_rag_modules():
-    """Lazy import RAG modules to avoid dependency issues when not needed."""
-    global create_chunks, generate_embeddings, load_model, build_and_save_index, rag_query
-    if 'create_chunks' not in globals():
-        from rag.chunker import create_chunks
-        from rag.embeddings import generate_embeddings
-        from rag.faiss_index import build_and_save_index
-        from rag.pipeline import rag_query
-
-# Import legacy output modules (for backward compatibility)
-from output import save_json, print_summary
+# RAG modules (sentence-transformers, torch, FAISS) and legacy output helpers
+# are imported inside the commands that use them to keep CLI startup fast.
 
 # Initialize logging
 Logger.initialize(log_level=Config.log_level(), log_file=Config.log_file())
@@ -52,6 +51,19 @@ logger = get_logger(__name__)
 Config.initialize()
 
 
+class _Emit:
+    """Writes CLI progress lines to stdout, or discards them when quiet."""
+
+    __slots__ = ("out",)
+
+    def __init__(self, quiet: bool = False):
+        self.out = (lambda *args, **kwargs: None) if quiet else sys.stdout.write
+
+
+# Progress writer for step-by-step status lines (replaced by main() for --quiet)
+_progress = _Emit()
+
+
 def analyze_file(file_path: str) -> dict:
     """
     Parse a Python file and extract code structure.
@@ -68,19 +80,56 @@ def analyze_file(file_path: str) -> dict:
     """
     logger.info(f"Starting analysis of file: {file_path}")
 
-    # Use the new SafeParser from core.ast_parser
-    file_analysis = SafeParser.parse_file(file_path)
+    file_analysis = _analyze_file_raw(file_path)
+
+    # Convert new format to legacy format for backward compatibility
+    logger.debug(f"Converting to legacy format")
+    legacy_result = _convert_to_legacy_format(file_analysis)
+
+    return legacy_result
+
+
+def _fatal(message: str, exc: Exception) -> NoReturn:
+    """Log a failure with traceback, report it to the user and exit with status 1."""
+    logger.error(f"{message}: {exc}", exc_info=exc)
+    print(f"✗ {message}: {exc}")
+    sys.exit(1)
+
+
+def _analyze_file_raw(file_path: str):
+    """
+    Parse a Python file with SafeParser and return the full FileAnalysis.
+
+    Results are cached per (path, mtime, size) so running several commands
+    on the same unchanged file in one process parses it only once.
+
+    Args:
+        file_path: Path to the Python file to analyze
+
+    Returns:
+        FileAnalysis from core.ast_parser (exits on analysis errors)
+    """
+    resolved_path = str(Path(file_path).resolve())
+    try:
+        stat = os.stat(resolved_path)
+    except OSError:
+        # Let SafeParser record the error in the usual way
+        file_analysis = SafeParser.parse_file(resolved_path)
+    else:
+        file_analysis = _parse_file_cached(resolved_path, stat.st_mtime_ns, stat.st_size)
 
     if file_analysis.errors:
         logger.warning(f"Errors during analysis: {file_analysis.errors}")
         print(f"✗ Analysis errors: {file_analysis.errors}")
         sys.exit(1)
 
-    # Convert new format to legacy format for backward compatibility
-    logger.debug(f"Converting to legacy format")
-    legacy_result = _convert_to_legacy_format(file_analysis)
+    return file_analysis
 
-    return legacy_result
+
+@lru_cache(maxsize=128)
+def _parse_file_cached(file_path: str, mtime_ns: int, size: int):
+    """Parse a file once per (path, mtime, size) key."""
+    return SafeParser.parse_file(file_path)
 
 
 def index_file(file_path: str) -> None:
@@ -96,42 +145,132 @@ def index_file(file_path: str) -> None:
     Args:
         file_path: Path to the Python file to index
     """
+    # Lazy import RAG modules
+    from rag.chunker import create_chunks_from_analysis
+
     logger.info(f"Starting indexing of file: {file_path}")
-    print(f"\n✓ Starting indexing of file: {file_path}")
+    _progress.out(f"\n✓ Starting indexing of file: {file_path}\n")
 
-    try:
-        print(f"  → Step 1: Analyzing file...")
-        result = analyze_file(file_path)
-        logger.debug(f"Analysis produced {len(result.get('functions', []))} functions")
-        print(f"  ✓ Analysis complete")
+    _progress.out(f"  → Step 1: Analyzing file...\n")
+    file_analysis = _analyze_file_raw(file_path)
+    logger.debug(f"Analysis produced {len(file_analysis.functions)} functions")
+    _progress.out(f"  ✓ Analysis complete\n")
+
+    _progress.out(f"  → Step 2: Creating chunks...\n")
+    chunks = create_chunks_from_analysis(file_analysis)
+    logger.info(f"Created {len(chunks)} semantic chunks")
+    _progress.out(f"  ✓ Created {len(chunks)} chunks\n")
+
+    _embed_and_index(chunks, "Indexing failed")
+
+    _progress.out(f"\n✓ Indexing complete! Indexed {len(chunks)} chunks for {file_path}\n")
+    logger.info(f"Indexing complete for {file_path}")
 
-        print(f"  → Step 2: Creating chunks...")
-        chunks = create_chunks(result)
-        logger.info(f"Created {len(chunks)} semantic chunks")
-        print(f"  ✓ Created {len(chunks)} chunks")
 
-        print(f"  → Step 3: Loading embedding model...")
+def _embed_and_index(chunks: list, failure_message: str) -> None:
+    """
+    Embed chunks and write the FAISS index (indexing steps 3-5).
+
+    Each step has its own error handling so a failure reports the step that
+    broke; failure_message prefixes the reported error.
+    """
+    # Lazy import RAG modules
+    from rag.embeddings import generate_embeddings, load_model
+    from rag.faiss_index import build_and_save_index
+
+    _progress.out(f"  → Step 3: Loading embedding model...\n")
+    try:
         model = load_model()
-        logger.info(f"Embedding model loaded: {Config.embedding_model()}")
-        print(f"  ✓ Model loaded successfully")
+    except Exception as e:
+        _fatal(f"{failure_message} while loading embedding model", e)
+    logger.info(f"Embedding model loaded: {Config.embedding_model()}")
+    _progress.out(f"  ✓ Model loaded successfully\n")
 
-        print(f"  → Step 4: Generating embeddings...")
+    _progress.out(f"  → Step 4: Generating embeddings...\n")
+    try:
         embeddings = generate_embeddings(chunks, model)
-        logger.debug(f"Generated {len(embeddings)} embeddings")
-        print(f"  ✓ Generated embeddings for {len(embeddings)} chunks")
+    except Exception as e:
+        _fatal(f"{failure_message} while generating embeddings", e)
+    logger.debug(f"Generated {len(embeddings)} embeddings")
+    _progress.out(f"  ✓ Generated embeddings for {len(embeddings)} chunks\n")
 
-        print(f"  → Step 5: Building FAISS index...")
+    _progress.out(f"  → Step 5: Building FAISS index...\n")
+    try:
         build_and_save_index(chunks, embeddings)
-        logger.info(f"FAISS index saved to {Config.faiss_index_path()}")
-        print(f"  ✓ FAISS index built and saved")
+    except Exception as e:
+        _fatal(f"{failure_message} while building FAISS index", e)
+    logger.info(f"FAISS index saved to {Config.faiss_index_path()}")
+    _progress.out(f"  ✓ FAISS index built and saved\n")
+
+
+def _chunk_project_files(project: ProjectAnalyzer, file_paths: list) -> list:
+    """
+    Parse a project's files and turn them into RAG chunks.
+
+    Parsing goes through SafeParser.iter_parse_files with the same worker
+    and parse-cache settings as project analysis. Each chunk is prefixed
+    with its file's path relative to the project root, so entities from
+    different files stay distinguishable and results can be traced back.
+    Files with parse errors or no entities contribute no chunks.
+
+    Args:
+        project: Analyzer for the project (provides the root path)
+        file_paths: Files to chunk, from project.collect_python_files()
+
+    Returns:
+        List of text chunks, in file order
+    """
+    from rag.chunker import create_chunks_from_analysis
+
+    chunks = []
+    file_analyses = SafeParser.iter_parse_files(
+        file_paths,
+        max_workers=Config.parse_workers(),
+        cache_dir=Config.parse_cache_dir(),
+    )
+    for file_path, file_analysis in zip(file_paths, file_analyses):
+        if file_analysis.errors or not file_analysis.entities:
+            continue
+        prefix = f"File: {os.path.relpath(file_path, project.root_path)}. "
+        chunks.extend(prefix + chunk for chunk in create_chunks_from_analysis(file_analysis))
+    return chunks
+
+
+def index_project(root_path: str) -> None:
+    """
+    Index every Python file in a project for RAG.
+
+    Parsing is serial unless PARSE_WORKERS > 1 (see
+    _chunk_project_files); the embedding model is loaded once in this process and all chunks are
+    embedded and indexed in a single batch.
+
+    Args:
+        root_path: Root directory of the project to index
+    """
+    logger.info(f"Starting project indexing: {root_path}")
+    _progress.out(f"\n✓ Starting indexing of project: {root_path}\n")
 
-        print(f"\n✓ Indexing complete! Indexed {len(chunks)} chunks for {file_path}")
-        logger.info(f"Indexing complete for {file_path}")
+    _progress.out(f"  → Step 1: Collecting Python files...\n")
+    project = ProjectAnalyzer(root_path)
+    file_paths = project.collect_python_files()
+    logger.info(f"Found {len(file_paths)} Python files to index")
+    _progress.out(f"  ✓ Found {len(file_paths)} files\n")
 
+    _progress.out(f"  → Step 2: Parsing and chunking files...\n")
+    try:
+        chunks = _chunk_project_files(project, file_paths)
     except Exception as e:
-        logger.error(f"Indexing failed: {e}", exc_info=True)
-        print(f"✗ Indexing failed: {e}")
+        _fatal("Project indexing failed while parsing files", e)
+    if not chunks:
+        print("✗ No code entities found to index")
         sys.exit(1)
+    logger.info(f"Created {len(chunks)} semantic chunks")
+    _progress.out(f"  ✓ Created {len(chunks)} chunks\n")
+
+    _embed_and_index(chunks, "Project indexing failed")
+
+    _progress.out(f"\n✓ Indexing complete! Indexed {len(chunks)} chunks from {len(file_paths)} files\n")
+    logger.info(f"Project indexing complete for {root_path}")
 
 
 def query_codebase(query: str) -> None:
@@ -145,27 +284,24 @@ def query_codebase(query: str) -> None:
         query: Natural language query about the codebase
     """
     # Lazy import RAG modules
-    _import_rag_modules()
+    from rag.pipeline import rag_query
 
     logger.info(f"Processing query: {query}")
-    print(f"\n✓ Starting query: '{query}'")
+    _progress.out(f"\n✓ Starting query: '{query}'\n")
 
+    _progress.out(f"  → Retrieving relevant context...\n")
     try:
-        print(f"  → Retrieving relevant context...")
         answer = rag_query(query)
-        logger.debug(f"RAG query returned answer of length {len(answer)}")
-        print(f"  ✓ Query processed")
-
-        print(f"\nQuery: {query}")
-        print(f"Answer: {answer}")
-
     except Exception as e:
-        logger.error(f"Query failed: {e}", exc_info=True)
-        print(f"✗ Query failed: {e}")
-        sys.exit(1)
+        _fatal("Query failed", e)
+    logger.debug(f"RAG query returned answer of length {len(answer)}")
+    _progress.out(f"  ✓ Query processed\n")
+
+    print(f"\nQuery: {query}")
+    print(f"Answer: {answer}")
 
 
-def analyze_project_semantic(root_path: str) -> None:
+def analyze_project_semantic(root_path: str, verbose: bool = False) -> None:
     """
     Analyze entire project with semantic indexing for domain-aware insights.
 
@@ -178,47 +314,48 @@ def analyze_project_semantic(root_path: str) -> None:
 
     Args:
         root_path: Root directory of the project to analyze
+        verbose: Print a progress line per analyzed file
     """
     logger.info(f"Starting semantic project analysis: {root_path}")
-    print(f"\n✓ Starting semantic analysis of project: {root_path}")
+    _progress.out(f"\n✓ Starting semantic analysis of project: {root_path}\n")
 
+    _progress.out(f"  → Step 1: Analyzing project structure...\n")
     try:
-        print(f"  → Step 1: Analyzing project structure...")
-        analysis, semantic_index = analyze_project_with_semantic(root_path)
-        logger.info(f"Analyzed {len(analysis.file_analyses)} files")
-        print(f"  ✓ Project structure analyzed")
-
-        print(f"  → Step 2: Building semantic index...")
-        logger.info(f"Built semantic index with {len(semantic_index.entities)} entities")
-        print(f"  ✓ Semantic index built")
-
-        print(f"  → Step 3: Domain tagging complete...")
-        accounting_files = sum(1 for sf in semantic_index.files.values() if sf.domain_context.is_accounting_related)
-        logger.info(f"Identified {accounting_files} accounting-related files")
-        print(f"  ✓ Tagged {accounting_files} accounting files")
-
-        print(f"  → Step 4: Workflow detection...")
-        logger.info(f"Detected {len(semantic_index.workflows)} workflows")
-        print(f"  ✓ Detected {len(semantic_index.workflows)} workflows")
-
-        print(f"  → Step 5: Quality scoring...")
-        high_quality = sum(1 for se in semantic_index.entities.values() if se.context_score.overall_score.value == "HIGH")
-        logger.info(f"Scored {high_quality} high-quality entities")
-        print(f"  ✓ Scored {high_quality} high-quality entities")
-
-        print(f"\n✓ Semantic analysis complete!")
-        print(f"  - Files analyzed: {len(semantic_index.files)}")
-        print(f"  - Entities indexed: {len(semantic_index.entities)}")
-        print(f"  - Workflows detected: {len(semantic_index.workflows)}")
-        print(f"  - Accounting files: {accounting_files}")
-        print(f"  - High-quality entities: {high_quality}")
-
-        logger.info("Semantic project analysis complete")
-
+        analysis, semantic_index = analyze_project_with_semantic(root_path, verbose=verbose)
     except Exception as e:
-        logger.error(f"Semantic analysis failed: {e}", exc_info=True)
-        print(f"✗ Semantic analysis failed: {e}")
-        sys.exit(1)
+        _fatal("Semantic analysis failed", e)
+    logger.info(f"Analyzed {len(analysis.file_analyses)} files")
+    _progress.out(f"  ✓ Project structure analyzed\n")
+
+    _progress.out(f"  → Step 2: Building semantic index...\n")
+    logger.info(f"Built semantic index with {len(semantic_index.entities)} entities")
+    _progress.out(f"  ✓ Semantic index built\n")
+
+    _progress.out(f"  → Step 3: Domain tagging complete...\n")
+    # Counted by build_index as it filled the index; no need to rescan it
+    accounting_files = semantic_index.metadata["accounting_files"]
+    logger.info(f"Identified {accounting_files} accounting-related files")
+    _progress.out(f"  ✓ Tagged {accounting_files} accounting files\n")
+
+    _progress.out(f"  → Step 4: Workflow detection...\n")
+    logger.info(f"Detected {len(semantic_index.workflows)} workflows")
+    _progress.out(f"  ✓ Detected {len(semantic_index.workflows)} workflows\n")
+
+    _progress.out(f"  → Step 5: Quality scoring...\n")
+    high_quality = semantic_index.metadata["high_quality_entities"]
+    logger.info(f"Scored {high_quality} high-quality entities")
+    _progress.out(f"  ✓ Scored {high_quality} high-quality entities\n")
+
+    sys.stdout.write(
+        f"\n✓ Semantic analysis complete!\n"
+        f"  - Files analyzed: {len(semantic_index.files)}\n"
+        f"  - Entities indexed: {len(semantic_index.entities)}\n"
+        f"  - Workflows detected: {len(semantic_index.workflows)}\n"
+        f"  - Accounting files: {accounting_files}\n"
+        f"  - High-quality entities: {high_quality}\n"
+    )
+
+    logger.info("Semantic project analysis complete")
 
 
 def query_semantic(query: str, index_path: str) -> None:
@@ -230,45 +367,41 @@ def query_semantic(query: str, index_path: str) -> None:
         index_path: Path to the semantic index JSON file
     """
     logger.info(f"Processing semantic query: '{query}' using index: {index_path}")
-    print(f"\n✓ Starting semantic query: '{query}'")
+    _progress.out(f"\n✓ Starting semantic query: '{query}'\n")
 
+    _progress.out(f"  → Loading semantic index...\n")
     try:
-        print(f"  → Loading semantic index...")
-        indexer = SemanticIndexer()
-        semantic_index = indexer.load_index(index_path)
-        logger.info(f"Loaded index with {len(semantic_index.entities)} entities")
-        print(f"  ✓ Index loaded")
-
-        print(f"  → Executing query...")
-        results = query_semantic_index(query, semantic_index, max_results=10)
-        logger.info(f"Query returned {len(results)} results")
-        print(f"  ✓ Query executed")
-
-        print(f"\n📋 Query Results for: '{query}'")
-        print("=" * 80)
-
-        if not results:
-            print("No matching results found.")
-            return
-
-        for i, result in enumerate(results, 1):
-            print(f"\n{i}. {result.entity_name}")
-            print(f"   📁 File: {result.file_path}")
-            print(f"   🎯 Relevance: {result.relevance_score:.2f}")
-            print(f"   🏷️  Domain Tags: {', '.join(result.domain_tags) if result.domain_tags else 'None'}")
-            print(f"   ⭐ Quality: {result.context_score}")
-            if result.short_context:
-                print(f"   📝 Context: {result.short_context}")
-            if result.reasoning:
-                print(f"   💡 Why: {result.reasoning[0]}")
-
-        print(f"\n" + "=" * 80)
-        print(f"Found {len(results)} relevant results")
-
+        semantic_index = SemanticIndexer().load_index(index_path)
     except Exception as e:
-        logger.error(f"Semantic query failed: {e}", exc_info=True)
-        print(f"✗ Semantic query failed: {e}")
-        sys.exit(1)
+        _fatal("Semantic query failed while loading index", e)
+    logger.info(f"Loaded index with {len(semantic_index.entities)} entities")
+    _progress.out(f"  ✓ Index loaded\n")
+
+    _progress.out(f"  → Executing query...\n")
+    results = query_semantic_index(query, semantic_index, max_results=10)
+    logger.info(f"Query returned {len(results)} results")
+    _progress.out(f"  ✓ Query executed\n")
+
+    print(f"\n📋 Query Results for: '{query}'")
+    print("=" * 80)
+
+    if not results:
+        print("No matching results found.")
+        return
+
+    for i, result in enumerate(results, 1):
+        print(f"\n{i}. {result.entity_name}")
+        print(f"   📁 File: {result.file_path}")
+        print(f"   🎯 Relevance: {result.relevance_score:.2f}")
+        print(f"   🏷️  Domain Tags: {', '.join(result.domain_tags) if result.domain_tags else 'None'}")
+        print(f"   ⭐ Quality: {result.context_score}")
+        if result.short_context:
+            print(f"   📝 Context: {result.short_context}")
+        if result.reasoning:
+            print(f"   💡 Why: {result.reasoning[0]}")
+
+    print(f"\n" + "=" * 80)
+    print(f"Found {len(results)} relevant results")
 
 
 def run_parity_test(function_name: str) -> None:
@@ -350,6 +483,10 @@ def run_parity_test(function_name: str) -> None:
         sys.exit(1)
 
 
+# Fetches (source, target) from a Relationship in one C-level call
+_rel_source_target = attrgetter("source", "target")
+
+
 def _convert_to_legacy_format(file_analysis) -> dict:
     """
     Convert FileAnalysis (new format) to legacy dict format.
@@ -370,51 +507,169 @@ def _convert_to_legacy_format(file_analysis) -> dict:
     Returns:
         Dictionary in legacy format
     """
-    # Extract functions
-    functions = [
-        {"name": f.name, "line": f.location.line_start}
-        for f in file_analysis.functions
-    ]
-
-    # Extract classes
-    classes = [
-        {"name": c.name, "line": c.location.line_start}
-        for c in file_analysis.classes
-    ]
-
-    # Extract imports
-    imports = [
-        imp.module for imp in file_analysis.imports
-        if imp.module  # Filter out empty module names
-    ]
+    # Extract functions, classes and imports in a single pass over entities
+    # (the FileAnalysis convenience properties each rescan the full list)
+    intern = sys.intern
+    functions = []
+    classes = []
+    imports = []
+    for entity in file_analysis.entities:
+        if isinstance(entity, Function):
+            functions.append({"name": intern(entity.name), "line": entity.location.line_start})
+        elif isinstance(entity, Class):
+            classes.append({"name": intern(entity.name), "line": entity.location.line_start})
+        elif isinstance(entity, Import):
+            if entity.module:  # Filter out empty module names
+                imports.append(intern(entity.module))
 
     # Convert relationships to legacy format: {source: [targets]}
-    relationships = {}
-    for rel in file_analysis.relationships:
-        if rel.source not in relationships:
-            relationships[rel.source] = []
-        relationships[rel.source].append(rel.target)
+    # Names are interned: the same callers/callees recur across files
+    relationships = defaultdict(list)
+    for source, target in map(_rel_source_target, file_analysis.relationships):
+        relationships[intern(source)].append(intern(target))
 
     return {
         "functions": functions,
         "classes": classes,
         "imports": imports,
-        "relationships": relationships,
+        "relationships": dict(relationships),
     }
 
 
-def main():
+def _dumps_json(data, indent: int = 2) -> str:
     """
-    Command-line interface for the Python Code Analyzer with Semantic Analysis.
+    Serialize data to a JSON string.
 
-    Supports commands:
-    - analyze: Extract code structure from a Python file
-    - analyze_project: Analyze entire Python project
-    - analyze_semantic: Analyze project with domain-aware semantic indexing
-    - index: Build FAISS index for RAG queries
-    - query: Query the indexed codebase using natural language (RAG)
-    - query_semantic: Query semantic index for domain-aware search
+    Uses orjson when installed (2-space or compact output only) and falls back
+    to the stdlib encoder otherwise.
+
+    Args:
+        data: JSON-serializable object
+        indent: Indentation width; 0 for compact output
     """
+    if orjson is not None and indent in (0, 2):
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(data, option=option).decode("utf-8")
+    # ensure_ascii=False: print non-ASCII identifiers as-is, like orjson
+    if not indent:
+        # Compact machine-readable output: no spaces after separators
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+    return json.dumps(data, indent=indent, ensure_ascii=False)
+
+
+def _run_analyze(args: argparse.Namespace) -> None:
+    """Handle the 'analyze' command: analyze a single file and report."""
+    logger.info(f"Running 'analyze' command on {args.path}")
+    from output import save_json, print_summary
+    print("=" * 60)
+    print("PYTHON CODE ANALYSIS REPORT")
+    print("=" * 60)
+    result = analyze_file(args.path)
+    # Encode once and reuse the text for both the file and stdout
+    result_text = _dumps_json(result, indent=args.indent)
+    save_json(result, filename="result.json", text=result_text)
+    print("\n✓ Analysis complete!")
+    print("\n" + "=" * 60)
+    print("DETAILED ANALYSIS OUTPUT")
+    print("=" * 60)
+    sys.stdout.write(result_text)
+    sys.stdout.write("\n")
+    print("\n" + "=" * 60)
+    print("ANALYSIS SUMMARY")
+    print("=" * 60)
+    print_summary(result)
+    print("=" * 60)
+
+
+def _run_analyze_project(args: argparse.Namespace) -> None:
+    """Handle the 'analyze_project' command: summarize a whole project."""
+    logger.info(f"Running 'analyze_project' command on {args.path}")
+    print("=" * 60)
+    print("PROJECT ANALYSIS SUMMARY")
+    print("=" * 60)
+    print(f"Path: {args.path}")
+    project_analysis = analyze_project(args.path, verbose=not args.quiet)
+    print(f"Python files analyzed: {len(project_analysis.file_analyses)}")
+    print(f"Functions found: {len(project_analysis.all_functions)}")
+    print(f"Classes found: {len(project_analysis.all_classes)}")
+    print("=" * 60)
+
+
+def _run_analyze_semantic(args: argparse.Namespace) -> None:
+    """Handle the 'analyze_semantic' command."""
+    logger.info(f"Running 'analyze_semantic' command on {args.path}")
+    analyze_project_semantic(args.path, verbose=not args.quiet)
+
+
+def _run_index(args: argparse.Namespace) -> None:
+    """Handle the 'index' command."""
+    logger.info(f"Running 'index' command on {args.path}")
+    index_file(args.path)
+
+
+def _run_index_project(args: argparse.Namespace) -> None:
+    """Handle the 'index_project' command."""
+    logger.info(f"Running 'index_project' command on {args.path}")
+    index_project(args.path)
+
+
+def _run_query(args: argparse.Namespace) -> None:
+    """Handle the 'query' command."""
+    logger.info(f"Running 'query' command: {args.query}")
+    if not args.query:
+        print("✗ --query argument is required for 'query' command")
+        sys.exit(1)
+    query_codebase(args.query)
+
+
+def _run_query_semantic(args: argparse.Namespace) -> None:
+    """Handle the 'query_semantic' command."""
+    logger.info(f"Running 'query_semantic' command: {args.query}")
+    if not args.query:
+        print("✗ --query argument is required for 'query_semantic' command")
+        sys.exit(1)
+    if not args.index:
+        print("✗ --index argument is required for 'query_semantic' command")
+        sys.exit(1)
+    query_semantic(args.query, args.index)
+
+
+def _run_parity_test(args: argparse.Namespace) -> None:
+    """Handle the 'parity_test' command (path is the function name)."""
+    logger.info(f"Running 'parity_test' command")
+    if not args.path:
+        print("✗ Function name is required for 'parity_test' command")
+        sys.exit(1)
+    run_parity_test(args.path)
+
+
+# CLI command name -> handler taking the parsed argparse.Namespace
+COMMAND_HANDLERS = {
+    "analyze": _run_analyze,
+    "analyze_project": _run_analyze_project,
+    "analyze_semantic": _run_analyze_semantic,
+    "index": _run_index,
+    "index_project": _run_index_project,
+    "query": _run_query,
+    "query_semantic": _run_query_semantic,
+    "parity_test": _run_parity_test,
+}
+
+
+# Cached parser; built on first use by _get_parser()
+_PARSER = None
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    """Return the command-line parser, building it once per process."""
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    return _PARSER
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
     parser = argparse.ArgumentParser(
         description="Legacy Code Modernization Platform - Code Analysis CLI with Semantic Analysis"
     )
@@ -425,7 +680,7 @@ def main():
     )
     parser.add_argument(
         "--command",
-        choices=["analyze", "analyze_project", "analyze_semantic", "index", "query", "query_semantic", "parity_test"],
+        choices=list(COMMAND_HANDLERS),
         help="Command to run (default: analyze if file provided)"
     )
     parser.add_argument(
@@ -436,8 +691,39 @@ def main():
         "--index",
         help="Path to semantic index JSON file for 'query_semantic' command"
     )
+    parser.add_argument(
+        "--indent",
+        type=int,
+        default=2,
+        help="JSON indentation for 'analyze' output and result.json (0 for compact, faster output)"
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Suppress step-by-step progress output"
+    )
+    return parser
+
+
+def main():
+    """
+    Command-line interface for the Python Code Analyzer with Semantic Analysis.
 
+    Supports commands:
+    - analyze: Extract code structure from a Python file
+    - analyze_project: Analyze entire Python project
+    - analyze_semantic: Analyze project with domain-aware semantic indexing
+    - index: Build FAISS index for RAG queries
+    - index_project: Build FAISS index for every file in a project
+    - query: Query the indexed codebase using natural language (RAG)
+    - query_semantic: Query semantic index for domain-aware search
+    - parity_test: Run Python/Go parity tests for a function
+    """
+    global _progress
+
+    parser = _get_parser()
     args = parser.parse_args()
+    _progress = _Emit(quiet=args.quiet)
 
     # Default behavior: if only a path is provided, analyze it
     if args.path and not args.command:
@@ -447,70 +733,7 @@ def main():
         return
 
     try:
-        if args.command == "analyze":
-            logger.info(f"Running 'analyze' command on {args.path}")
-            print("=" * 60)
-            print("PYTHON CODE ANALYSIS REPORT")
-            print("=" * 60)
-            result = analyze_file(args.path)
-            save_json(result, filename="result.json")
-            print("\n✓ Analysis complete!")
-            print("\n" + "=" * 60)
-            print("DETAILED ANALYSIS OUTPUT")
-            print("=" * 60)
-            print(json.dumps(result, indent=2))
-            print("\n" + "=" * 60)
-            print("ANALYSIS SUMMARY")
-            print("=" * 60)
-            print_summary(result)
-            print("=" * 60)
-
-        elif args.command == "analyze_project":
-            logger.info(f"Running 'analyze_project' command on {args.path}")
-            print("=" * 60)
-            print("PROJECT ANALYSIS SUMMARY")
-            print("=" * 60)
-            print(f"Path: {args.path}")
-            project_analysis = analyze_project(args.path)
-            print(f"Python files analyzed: {len(project_analysis.file_analyses)}")
-            print(f"Functions found: {len(project_analysis.all_functions)}")
-            print(f"Classes found: {len(project_analysis.all_classes)}")
-            print("=" * 60)
-
-        elif args.command == "analyze_semantic":
-            logger.info(f"Running 'analyze_semantic' command on {args.path}")
-            analyze_project_semantic(args.path)
-
-        elif args.command == "index":
-            logger.info(f"Running 'index' command on {args.path}")
-            index_file(args.path)
-
-        elif args.command == "query":
-            logger.info(f"Running 'query' command: {args.query}")
-            if not args.query:
-                print("✗ --query argument is required for 'query' command")
-                sys.exit(1)
-            query_codebase(args.query)
-
-        elif args.command == "query_semantic":
-            logger.info(f"Running 'query_semantic' command: {args.query}")
-            if not args.query:
-                print("✗ --query argument is required for 'query_semantic' command")
-                sys.exit(1)
-            if not args.index:
-                print("✗ --index argument is required for 'query_semantic' command")
-                sys.exit(1)
-            query_semantic(args.query, args.index)
-
-        elif args.command == "parity_test":
-            logger.info(f"Running 'parity_test' command")
-            if not args.path:
-                print("✗ Function name is required for 'parity_test' command")
-                sys.exit(1)
-            run_parity_test(args.path)
-
-        else:
-            parser.print_help()
+        COMMAND_HANDLERS[args.command](args)
 
     except KeyboardInterrupt:
         logger.info("Program interrupted by user")
@@ -6,4 +6,6 @@ This package contains the foundational analysis modules:
 - entity_extractor: Extract functions, classes, imports
 - dependency_graph: Build and analyze code dependencies
 - models: Data structures for analysis results
+- text_prep: Memoized lowercasing/tokenizing shared by scorer and tagger
+- parse_cache: Opt-in on-disk cache of parse results across runs
 """
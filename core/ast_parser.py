@@ -4,27 +4,34 @@ AST-based Python code parser for extracting code entities and relationships.
 Design Rationale:
 - Pure AST analysis using Python's built-in ast module
 - Produces FileAnalysis objects (models.FileAnalysis)
-- Two-pass approach: first extract entities, then extract relationships
+- Single pass: entities and relationships are extracted in one traversal
 - Handles async functions, decorators, inheritance, and method extraction
 - Provides detailed error reporting and logging
 
 Architecture Pattern:
 - ASTVisitor classes (NodeVisitor subclasses) for traversal
-- EntityExtractor: Pass 1 - extract all entities
-- RelationshipExtractor: Pass 2 - find dependencies and calls
+- EntityExtractor: extract all entities
+- RelationshipExtractor: find dependencies and calls
+- FusedExtractor: both of the above in one traversal (used by SafeParser)
 - SafeParser: Main entry point with error handling
 """
 
 import ast
+import inspect
+import mmap
+import os
 import sys
-from pathlib import Path
-from typing import List, Optional, Dict, Set, Tuple
+from functools import lru_cache, partial
+from itertools import chain
+from operator import attrgetter
+from typing import Iterable, Iterator, List, Optional, Dict, Set, Tuple
 from dataclasses import dataclass
 
 from core.models import (
     Entity, Function, Class, Import, Relationship,
     Location, EntityType, RelationType, FileAnalysis
 )
+from core.parse_cache import parse_with_cache
 from utils.logger import get_logger
 from utils.config import Config
 
@@ -32,6 +39,110 @@ from utils.config import Config
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _max_file_size_mb() -> int:
+    """
+    Config.max_file_size_mb(), read once per process.
+
+    Config parses the environment on every call; parse_file runs per file.
+    Call _max_file_size_mb.cache_clear() after changing MAX_FILE_SIZE_MB.
+    """
+    return Config.max_file_size_mb()
+
+
+# Argument name of an ast.arg node
+_arg_name = attrgetter("arg")
+
+# ast.PyCF_OPTIMIZED_AST (Python 3.13+) folds constants while parsing
+_PARSE_FLAGS = ast.PyCF_ONLY_AST | getattr(ast, "PyCF_OPTIMIZED_AST", 0)
+
+
+def _parse_file_object(f, file_path: str, size: int) -> ast.Module:
+    """
+    Parse an open binary file into an AST without copying it into memory.
+
+    The file is memory-mapped and the mapping is handed to compile(), which
+    accepts any bytes-like source (mmap cannot map an empty file).
+    """
+    if size == 0:
+        source = b""
+    else:
+        source = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        return compile(
+            source, file_path, "exec",
+            flags=_PARSE_FLAGS, dont_inherit=True, optimize=1,
+        )
+    finally:
+        if isinstance(source, mmap.mmap):
+            source.close()
+
+
+# Characters inspect.cleandoc strips from the start of a docstring's first
+# line: only spaces since Python 3.13, any whitespace before
+_FIRST_LINE_STRIP = " " if sys.version_info >= (3, 13) else None
+
+
+def _get_docstring(node: ast.AST) -> str:
+    """
+    Return the cleaned docstring of a function/class node, or "".
+
+    Same result as ast.get_docstring(node) or "", but with exact type checks
+    and without inspect.cleandoc for one-line docstrings (the common case),
+    where cleaning reduces to expanding tabs and stripping the first line's
+    leading whitespace (see _FIRST_LINE_STRIP).
+    """
+    body = node.body
+    if body:
+        first = body[0]
+        if type(first) is ast.Expr:
+            value = first.value
+            if type(value) is ast.Constant and type(value.value) is str:
+                text = value.value
+                if "\n" not in text:
+                    return text.expandtabs().lstrip(_FIRST_LINE_STRIP)
+                return inspect.cleandoc(text)
+    return ""
+
+
+def _iter_calls(node: ast.AST) -> List[ast.Call]:
+    """
+    Collect every Call node under node, in ast.walk (breadth-first) order.
+
+    Equivalent to filtering ast.walk() for ast.Call, but iterates a plain
+    list instead of a deque-backed generator and checks exact node types.
+    """
+    calls = []
+    todo = [node]
+    for current in todo:  # todo grows while we iterate: breadth-first
+        todo.extend(ast.iter_child_nodes(current))
+        if type(current) is ast.Call:
+            calls.append(current)
+    return calls
+
+
+def _get_name_from_node(node: ast.AST) -> str:
+    """
+    Extract a dotted name from a Name/Attribute chain (e.g. "a.b.c").
+
+    Walks Attribute.value iteratively; if the chain does not end in a Name
+    (e.g. factory().attr), the attribute parts alone are returned.
+    """
+    parts = []
+    node_type = type(node)
+    while node_type is ast.Attribute:
+        parts.append(node.attr)
+        node = node.value
+        node_type = type(node)
+    if node_type is ast.Name:
+        if not parts:
+            return node.id  # Identifiers are already interned by the parser
+        parts.append(node.id)
+    parts.reverse()
+    # Dotted names (self.save, os.path.join) recur throughout a codebase
+    return sys.intern(".".join(parts))
+
+
 class EntityExtractor(ast.NodeVisitor):
     """
     First pass: Extract all functions, classes, and imports from AST.
@@ -45,7 +156,7 @@ class EntityExtractor(ast.NodeVisitor):
     def __init__(self, file_path: str):
         self.file_path = file_path
         self.entities: List[Entity] = []
-        self.current_class: Optional[Class] = None
+        self.current_class: Optional[str] = None  # Name of the enclosing class
         self.current_class_methods: List[Function] = []
     
     def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
@@ -63,21 +174,34 @@ class EntityExtractor(ast.NodeVisitor):
         If we're inside a class, add to current_class_methods.
         Otherwise, add to entities as a standalone function.
         """
-        docstring = ast.get_docstring(node) or ""
+        docstring = _get_docstring(node)
         
         # Get source code snippet (first 100 chars of docstring as preview)
         source_preview = docstring[:100] if docstring else ""
         
-        # Get decorator names
-        decorators = [d.id if isinstance(d, ast.Name) else "" for d in node.decorator_list]
-        decorators = [d for d in decorators if d]  # Filter empty strings
+        # Get decorator names: @name, @module.name and @name(...) forms
+        decorators = []
+        for decorator in node.decorator_list:
+            if type(decorator) is ast.Call:
+                decorator = decorator.func
+            decorator_name = _get_name_from_node(decorator)
+            if decorator_name:
+                decorators.append(decorator_name)
         
         entity_type = EntityType.ASYNC_FUNCTION if is_async else EntityType.FUNCTION
         
+        # Positional-only, regular and keyword-only parameter names
+        arguments = node.args
+        arg_names = list(map(_arg_name, chain(
+            arguments.posonlyargs, arguments.args, arguments.kwonlyargs
+        )))
+        
+        # end_lineno is always set by the parser on 3.8+; fall back if None
+        line_end = node.end_lineno or node.lineno
         location = Location(
             file_path=self.file_path,
             line_start=node.lineno,
-            line_end=getattr(node, 'end_lineno', node.lineno),
+            line_end=line_end,
         )
         
         func = Function(
@@ -89,8 +213,8 @@ class EntityExtractor(ast.NodeVisitor):
             metadata={
                 "is_async": is_async,
                 "decorators": decorators,
-                "args": [arg.arg for arg in node.args.args],
-                "line_count": (getattr(node, 'end_lineno', node.lineno) - node.lineno + 1),
+                "args": arg_names,
+                "line_count": line_end - node.lineno + 1,
             }
         )
         
@@ -105,7 +229,7 @@ class EntityExtractor(ast.NodeVisitor):
     
     def visit_ClassDef(self, node: ast.ClassDef) -> None:
         """Extract a class definition and all its methods."""
-        docstring = ast.get_docstring(node) or ""
+        docstring = _get_docstring(node)
         
         # Get base class names
         base_classes = []
@@ -119,38 +243,30 @@ class EntityExtractor(ast.NodeVisitor):
         location = Location(
             file_path=self.file_path,
             line_start=node.lineno,
-            line_end=getattr(node, 'end_lineno', node.lineno),
+            line_end=node.end_lineno or node.lineno,
         )
         
         # Temporarily store current class context
         prev_class = self.current_class
         prev_methods = self.current_class_methods
         
-        self.current_class = Class(
+        self.current_class = node.name
+        self.current_class_methods = []
+        
+        # Visit class body (will populate current_class_methods); bases,
+        # keywords and decorators are expressions and hold no definitions
+        for statement in node.body:
+            self.visit(statement)
+        
+        # Build the class once its methods are known (dataclass is frozen)
+        self.entities.append(Class(
             name=node.name,
             type=EntityType.CLASS,
             location=location,
             docstring=docstring,
-            base_classes=base_classes,
-        )
-        self.current_class_methods = []
-        
-        # Visit class body (will populate current_class_methods)
-        self.generic_visit(node)
-        
-        # Finalize class with extracted methods
-        # We need to reconstruct since dataclass is frozen
-        finalized_class = Class(
-            name=self.current_class.name,
-            type=self.current_class.type,
-            location=self.current_class.location,
-            docstring=self.current_class.docstring,
-            source_code=self.current_class.source_code,
-            metadata=self.current_class.metadata,
-            methods=self.current_class_methods,
-            base_classes=self.current_class.base_classes,
-        )
-        self.entities.append(finalized_class)
+            methods=tuple(self.current_class_methods),
+            base_classes=tuple(base_classes),
+        ))
         
         # Restore previous class context
         self.current_class = prev_class
@@ -158,6 +274,7 @@ class EntityExtractor(ast.NodeVisitor):
     
     def visit_Import(self, node: ast.Import) -> None:
         """Extract an import statement."""
+        add_entity = self.entities.append
         for alias in node.names:
             name = alias.asname if alias.asname else alias.name
             location = Location(
@@ -173,12 +290,13 @@ class EntityExtractor(ast.NodeVisitor):
                 alias=alias.asname,
                 is_from=False,
             )
-            self.entities.append(imp)
+            add_entity(imp)
     
     def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
         """Extract a from...import statement."""
         module = node.module if node.module else ""
         
+        add_entity = self.entities.append
         for alias in node.names:
             name = alias.asname if alias.asname else alias.name
             location = Location(
@@ -197,17 +315,9 @@ class EntityExtractor(ast.NodeVisitor):
                 alias=alias.asname,
                 is_from=True,
             )
-            self.entities.append(imp)
+            add_entity(imp)
     
-    @staticmethod
-    def _get_name_from_node(node: ast.AST) -> str:
-        """Extract name string from various AST node types."""
-        if isinstance(node, ast.Name):
-            return node.id
-        elif isinstance(node, ast.Attribute):
-            return f"{EntityExtractor._get_name_from_node(node.value)}.{node.attr}"
-        else:
-            return ""
+    _get_name_from_node = staticmethod(_get_name_from_node)
 
 
 class RelationshipExtractor(ast.NodeVisitor):
@@ -246,9 +356,8 @@ class RelationshipExtractor(ast.NodeVisitor):
             self.current_function = func_name
         
         # Look for function calls
-        for child in ast.walk(node):
-            if isinstance(child, ast.Call):
-                self._extract_call(child)
+        for call in _iter_calls(node):
+            self._extract_call(call)
         
         self.current_function = prev_func
     
@@ -269,8 +378,9 @@ class RelationshipExtractor(ast.NodeVisitor):
                 )
                 self.relationships.append(rel)
         
-        # Visit methods inside class
-        self.generic_visit(node)
+        # Visit methods inside class (only the body can hold definitions)
+        for statement in node.body:
+            self.visit(statement)
         
         self.current_class = prev_class
     
@@ -301,16 +411,58 @@ class RelationshipExtractor(ast.NodeVisitor):
         )
         self.relationships.append(rel)
     
-    @staticmethod
-    def _get_name_from_node(node: ast.AST) -> str:
-        """Extract callable name from AST node."""
-        if isinstance(node, ast.Name):
-            return node.id
-        elif isinstance(node, ast.Attribute):
-            value = RelationshipExtractor._get_name_from_node(node.value)
-            return f"{value}.{node.attr}" if value else node.attr
+    _get_name_from_node = staticmethod(_get_name_from_node)
+
+
+class FusedExtractor(EntityExtractor):
+    """
+    Single pass: extract entities and relationships together.
+
+    Produces the same entities as EntityExtractor and the same relationships,
+    in the same order, as RelationshipExtractor, while walking the tree once.
+    """
+
+    def __init__(self, file_path: str):
+        super().__init__(file_path)
+        self.relationships: List[Relationship] = []
+
+    def _extract_function(self, node: ast.AST, is_async: bool) -> None:
+        """Extract the function entity, then the calls made inside it."""
+        super()._extract_function(node, is_async)
+
+        if self.current_class:
+            source = sys.intern(f"{self.current_class}.{node.name}")
         else:
-            return ""
+            source = node.name
+
+        # Bind once: this loop runs for every call in the function body
+        add_relationship = self.relationships.append
+        file_path = self.file_path
+
+        for call in _iter_calls(node):
+            called_name = _get_name_from_node(call.func)
+            if not called_name:
+                continue
+            add_relationship(Relationship(
+                source=source,
+                target=called_name,
+                type=RelationType.CALLS,
+                source_location=Location(file_path=file_path, line_start=call.lineno),
+            ))
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        """Extract inheritance relationships, then the class and its methods."""
+        for base in node.bases:
+            base_name = _get_name_from_node(base)
+            if base_name:
+                self.relationships.append(Relationship(
+                    source=node.name,
+                    target=base_name,
+                    type=RelationType.INHERITS,
+                    source_location=Location(file_path=self.file_path, line_start=node.lineno),
+                ))
+
+        super().visit_ClassDef(node)
 
 
 class SafeParser:
@@ -331,35 +483,32 @@ class SafeParser:
         Returns:
             FileAnalysis with extracted entities, relationships, and any errors
         """
-        file_path = str(Path(file_path).resolve())
+        # Interned: the path is shared by every Location in the file and is
+        # the key of project-level indexes
+        file_path = sys.intern(os.path.realpath(file_path))  # == str(Path(...).resolve())
         analysis = FileAnalysis(file_path=file_path)
         
         try:
-            # Read file
-            with open(file_path, 'r', encoding='utf-8') as f:
-                source_code = f.read()
-            
-            # Check file size (avoid analyzing huge files)
-            max_size = Config.max_file_size_mb() * 1024 * 1024
-            if len(source_code) > max_size:
-                analysis.errors.append(
-                    f"File exceeds maximum size ({Config.max_file_size_mb()} MB)"
-                )
-                logger.warning(f"Skipping {file_path}: file too large")
-                return analysis
-            
-            # Parse AST
-            tree = ast.parse(source_code, filename=file_path)
-            
-            # Extract entities (first pass)
-            entity_extractor = EntityExtractor(file_path)
-            entity_extractor.visit(tree)
-            analysis.entities = entity_extractor.entities
+            with open(file_path, 'rb') as f:
+                # Check file size before reading (avoid analyzing huge files)
+                max_size_mb = _max_file_size_mb()
+                size = os.fstat(f.fileno()).st_size
+                if size > max_size_mb * 1024 * 1024:
+                    analysis.errors.append(
+                        f"File exceeds maximum size ({max_size_mb} MB)"
+                    )
+                    logger.warning(f"Skipping {file_path}: file too large")
+                    return analysis
+
+                # Parse AST straight from the mapped file: compile() decodes
+                # the bytes itself (BOM and coding cookie included)
+                tree = _parse_file_object(f, file_path, size)
             
-            # Extract relationships (second pass)
-            relationship_extractor = RelationshipExtractor(file_path, analysis.entities)
-            relationship_extractor.visit(tree)
-            analysis.relationships = relationship_extractor.relationships
+            # Extract entities and relationships in a single pass
+            extractor = FusedExtractor(file_path)
+            extractor.visit(tree)
+            analysis.entities = extractor.entities
+            analysis.relationships = extractor.relationships
             
             logger.info(
                 f"Parsed {file_path}: "
@@ -369,9 +518,15 @@ class SafeParser:
             )
         
         except SyntaxError as e:
-            error_msg = f"Syntax error at line {e.lineno}: {e.msg}"
-            analysis.errors.append(error_msg)
-            logger.error(f"Syntax error in {file_path}: {error_msg}")
+            if e.msg.startswith("(unicode error)"):
+                # compile() reports undecodable bytes as a SyntaxError
+                error_msg = f"Encoding error: {e.msg}"
+                analysis.errors.append(error_msg)
+                logger.error(f"Encoding error in {file_path}: {error_msg}")
+            else:
+                error_msg = f"Syntax error at line {e.lineno}: {e.msg}"
+                analysis.errors.append(error_msg)
+                logger.error(f"Syntax error in {file_path}: {error_msg}")
         
         except UnicodeDecodeError as e:
             error_msg = f"Encoding error: {e}"
@@ -384,3 +539,88 @@ class SafeParser:
             logger.error(f"Error parsing {file_path}: {error_msg}")
         
         return analysis
+
+    @staticmethod
+    def iter_parse_files(
+        file_paths: Iterable[str],
+        max_workers: Optional[int] = None,
+        cache_dir: Optional[str] = None,
+    ) -> Iterator[FileAnalysis]:
+        """
+        Parse many files, optionally in worker processes, yielding results
+        in input order.
+
+        Serial unless max_workers > 1. Parsing is pure-Python CPU work, so
+        processes (not threads) are used when asked for; starting them is
+        only worth it on large projects, and library callers should not
+        get processes they did not request. If the pool breaks (e.g. the
+        spawn start method re-importing an unguarded __main__), the
+        remaining files are parsed in-process.
+
+        Args:
+            file_paths: Paths to the Python files
+            max_workers: Worker process count (None: serial)
+            cache_dir: Parse cache directory (see core.parse_cache); None
+                parses every file
+
+        Yields:
+            FileAnalysis for each path, in the order given
+        """
+        file_paths = list(file_paths)
+        workers = max_workers or 1
+        # partial of a module-level function stays picklable for the pool
+        worker = partial(_parse_file_guarded, cache_dir=cache_dir) if cache_dir else _parse_file_guarded
+
+        if workers == 1 or len(file_paths) < 2:
+            for file_path in file_paths:
+                yield worker(file_path)
+            return
+
+        # Imported here: concurrent.futures.process and multiprocessing add
+        # noticeable startup time to every CLI command otherwise
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunksize = max(1, len(file_paths) // (workers * 4))
+        done = 0
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for analysis in executor.map(worker, file_paths, chunksize=chunksize):
+                    yield analysis
+                    done += 1
+        except Exception as e:
+            # Workers never raise (see _parse_file_guarded), so this is the
+            # pool itself failing: finish the remaining files in-process
+            logger.warning(
+                f"Parse worker pool failed ({type(e).__name__}: {e}); "
+                f"parsing {len(file_paths) - done} remaining files serially"
+            )
+            for file_path in file_paths[done:]:
+                yield worker(file_path)
+
+    @staticmethod
+    def parse_files(
+        file_paths: Iterable[str], max_workers: Optional[int] = None
+    ) -> List[FileAnalysis]:
+        """
+        Parse many files, optionally in parallel (see iter_parse_files).
+
+        Args:
+            file_paths: Paths to the Python files
+            max_workers: Worker process count (None: serial)
+
+        Returns:
+            List of FileAnalysis, in the order given
+        """
+        return list(SafeParser.iter_parse_files(file_paths, max_workers))
+
+
+def _parse_file_guarded(file_path: str, cache_dir: Optional[str] = None) -> FileAnalysis:
+    """Worker entry point: parse_file, turning any escaped exception into an error."""
+    try:
+        if cache_dir:
+            return parse_with_cache(file_path, cache_dir, SafeParser.parse_file)
+        return SafeParser.parse_file(file_path)
+    except Exception as e:
+        error_msg = f"Failed to analyze {file_path}: {e}"
+        logger.error(error_msg)
+        return FileAnalysis(file_path=file_path, errors=[error_msg])
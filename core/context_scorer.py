@@ -8,18 +8,62 @@ Design:
 - Lightweight, explainable scoring rules
 - Focus on domain relevance, connectivity, and documentation
 - Separate from AST extraction layer
+- Single-process: scoring a file costs less than pickling it to a worker,
+  and it needs project-wide relationship indexes, so scoring never fans
+  out across processes (parsing does; semantic index tagging can, opt-in)
 """
 
+import weakref
+from functools import lru_cache
+from collections import Counter, defaultdict
 from dataclasses import dataclass, field
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Set, Tuple
 from enum import Enum
-from pathlib import Path
 
 from core.models import FileAnalysis, Entity, EntityType, Relationship, RelationType, ProjectAnalysis
+from core.text_prep import keyword_count, lower_text
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Keyword tables for the domain relevance / docstring heuristics, built once
+# at import instead of on every call
+_FILE_DOMAIN_KEYWORDS = (
+    'account', 'ledger', 'journal', 'invoice', 'payment', 'tax',
+    'balance', 'posting', 'transaction', 'finance', 'erp'
+)
+_ENTITY_DOMAIN_KEYWORDS = (
+    'account', 'ledger', 'journal', 'invoice', 'payment', 'tax',
+    'balance', 'posting', 'transaction', 'debit', 'credit', 'gl'
+)
+_BUSINESS_VERBS = ('create', 'post', 'validate', 'calculate', 'process')
+_DOCSTRING_TERMS = ('function', 'class', 'method', 'calculate', 'create', 'validate')
+
+
+@lru_cache(maxsize=16384)
+def _docstring_quality(docstring: str) -> float:
+    """
+    Docstring quality score for a non-empty docstring.
+
+    Depends only on the text, so it is memoized: stock docstrings are
+    shared by many entities.
+    """
+    stripped = docstring.strip()
+
+    # Length score
+    length_score = min(len(stripped) * 0.002, 0.6)  # Cap at 0.6
+
+    # Content quality heuristics
+    content_score = 0.0
+    if len(stripped.split()) > 5:  # More than 5 words
+        content_score += 0.2
+    if 'Args:' in stripped or 'Returns:' in stripped:  # Structured
+        content_score += 0.2
+    if keyword_count(docstring, _DOCSTRING_TERMS):
+        content_score += 0.2
+
+    return min(length_score + content_score, 1.0)
+
 
 class QualityScore(str, Enum):
     """Quality score levels."""
@@ -62,7 +106,96 @@ class ContextScorer:
 
     def __init__(self):
         """Initialize scorer."""
-        pass
+        # Per-project memo of relationship indexes, keyed by id(project) and
+        # dropped when the ProjectAnalysis is garbage collected
+        self._project_caches: Dict[int, Dict[str, Any]] = {}
+
+    def _project_cache(self, project_analysis: 'ProjectAnalysis') -> Dict[str, Any]:
+        """Return the memo dict for a project, creating it on first use."""
+        key = id(project_analysis)
+        cache = self._project_caches.get(key)
+        if cache is None:
+            cache = {}
+            self._project_caches[key] = cache
+            weakref.finalize(project_analysis, self._project_caches.pop, key, None)
+        return cache
+
+    def _file_relationship_counts(self, project_analysis: 'ProjectAnalysis') -> Tuple[Counter, Set[int]]:
+        """
+        Count, per file, the project relationships touching its entities.
+
+        Built once per project in O(entities + relationships) instead of
+        scanning every relationship for every file.
+
+        Returns:
+            (counts keyed by id(file_analysis), ids of the indexed files)
+        """
+        cache = self._project_cache(project_analysis)
+        if "file_rel_counts" not in cache:
+            # entity name -> ids of the files that define it
+            entity_files: Dict[str, List[int]] = defaultdict(list)
+            for fa in project_analysis.file_analyses:
+                file_id = id(fa)
+                for name in fa.entity_name_set:
+                    entity_files[name].append(file_id)
+
+            counts: Counter = Counter()
+            for rel in project_analysis.all_relationships:
+                source_files = entity_files.get(rel.source, ())
+                target_files = entity_files.get(rel.target, ())
+                if target_files:
+                    # A relationship counts once per file, even if both ends match
+                    counts.update(set(source_files).union(target_files))
+                else:
+                    counts.update(source_files)
+
+            cache["file_rel_counts"] = (
+                counts,
+                {id(fa) for fa in project_analysis.file_analyses},
+            )
+        return cache["file_rel_counts"]
+
+    @staticmethod
+    def _count_relationships_by_name(relationships: List[Relationship]) -> Counter:
+        """Count relationships per entity name (a self-relationship counts once)."""
+        counts: Counter = Counter()
+        for rel in relationships:
+            counts[rel.source] += 1
+            if rel.target != rel.source:
+                counts[rel.target] += 1
+        return counts
+
+    def _entity_relationship_counts(
+        self, file_analysis: FileAnalysis, project_analysis: 'ProjectAnalysis'
+    ) -> Tuple[Counter, Counter]:
+        """
+        Relationship counts per entity name, within the file and project-wide.
+
+        Both counters are memoized per project (the file counter per file),
+        so scoring every entity is O(entities + relationships) overall.
+
+        Returns:
+            (file-level counts, project-level counts)
+        """
+        cache = self._project_cache(project_analysis)
+        if "entity_rel_counts" not in cache:
+            cache["entity_rel_counts"] = self._count_relationships_by_name(
+                project_analysis.all_relationships
+            )
+            cache["file_entity_rel_counts"] = {}
+        project_counts = cache["entity_rel_counts"]
+
+        _, indexed_files = self._file_relationship_counts(project_analysis)
+        if id(file_analysis) not in indexed_files:
+            # File is not part of the project: don't memoize by its id
+            return self._count_relationships_by_name(file_analysis.relationships), project_counts
+
+        file_counts_by_id = cache["file_entity_rel_counts"]
+        file_counts = file_counts_by_id.get(id(file_analysis))
+        if file_counts is None:
+            file_counts = self._count_relationships_by_name(file_analysis.relationships)
+            file_counts_by_id[id(file_analysis)] = file_counts
+        return file_counts, project_counts
 
     def score_file(self, file_analysis: FileAnalysis, project_analysis: 'ProjectAnalysis') -> ContextScore:
         """
@@ -184,17 +317,52 @@ class ContextScorer:
             reasoning=reasoning
         )
 
+    def score_project(self, project_analysis: 'ProjectAnalysis') -> Dict[str, ContextScore]:
+        """
+        Score every file in a project.
+
+        The project-wide relationship index is built once up front and
+        shared by all files, instead of being built lazily on the first
+        score_file call.
+
+        Args:
+            project_analysis: Full project context
+
+        Returns:
+            Mapping of file path to ContextScore
+        """
+        self._file_relationship_counts(project_analysis)
+        return {
+            fa.file_path: self.score_file(fa, project_analysis)
+            for fa in project_analysis.file_analyses
+        }
+
+    def score_all_entities(self, project_analysis: 'ProjectAnalysis') -> Dict[str, List[ContextScore]]:
+        """
+        Score every entity in a project.
+
+        Args:
+            project_analysis: Full project context
+
+        Returns:
+            Mapping of file path to entity scores, in file_analysis.entities order
+        """
+        # Build the project-wide and per-file name counts before scoring
+        for fa in project_analysis.file_analyses:
+            self._entity_relationship_counts(fa, project_analysis)
+        return {
+            fa.file_path: [self.score_entity(entity, fa, project_analysis) for entity in fa.entities]
+            for fa in project_analysis.file_analyses
+        }
+
     def _calculate_domain_relevance_file(self, file_analysis: FileAnalysis) -> float:
         """Calculate domain relevance for a file."""
-        file_path = Path(file_analysis.file_path).name.lower()
-
-        # Check file name for accounting keywords
-        accounting_keywords = [
-            'account', 'ledger', 'journal', 'invoice', 'payment', 'tax',
-            'balance', 'posting', 'transaction', 'finance', 'erp'
-        ]
+        file_name = file_analysis.path.name
 
-        keyword_matches = sum(1 for kw in accounting_keywords if kw in file_path)
+        # Check file name for accounting keywords. Substring matches are kept
+        # on purpose ('account' must hit 'accounts_ledger.py'), so the count
+        # is memoized per name rather than switched to a token-set lookup.
+        keyword_matches = keyword_count(file_name, _FILE_DOMAIN_KEYWORDS)
         base_score = min(keyword_matches * 0.2, 0.6)  # Max 0.6 from filename
 
         # Boost if file has many entities (likely core business logic)
@@ -207,23 +375,16 @@ class ContextScorer:
 
     def _calculate_domain_relevance_entity(self, entity: Entity) -> float:
         """Calculate domain relevance for an entity."""
-        name_lower = entity.name.lower()
-        docstring_lower = (entity.docstring or "").lower()
-
-        # Accounting keywords in name or docstring
-        accounting_keywords = [
-            'account', 'ledger', 'journal', 'invoice', 'payment', 'tax',
-            'balance', 'posting', 'transaction', 'debit', 'credit', 'gl'
-        ]
-
-        name_matches = sum(1 for kw in accounting_keywords if kw in name_lower)
-        doc_matches = sum(1 for kw in accounting_keywords if kw in docstring_lower)
+        # Accounting keywords in name or docstring (names like __init__ and
+        # shared docstrings recur, so the counts are memoized per text)
+        name_matches = keyword_count(entity.name, _ENTITY_DOMAIN_KEYWORDS)
+        doc_matches = keyword_count(entity.docstring or "", _ENTITY_DOMAIN_KEYWORDS)
 
         # Score based on matches
         score = min((name_matches * 0.3) + (doc_matches * 0.2), 1.0)
 
         # Boost for functions with business-sounding names
-        if any(term in name_lower for term in ['create', 'post', 'validate', 'calculate', 'process']):
+        if keyword_count(entity.name, _BUSINESS_VERBS):
             score = min(score + 0.2, 1.0)
 
         return score
@@ -231,12 +392,16 @@ class ContextScorer:
     def _calculate_relationship_density_file(self, file_analysis: FileAnalysis, project_analysis: 'ProjectAnalysis') -> float:
         """Calculate relationship density for a file."""
         # Count relationships involving entities in this file
-        file_entity_names = {e.name for e in file_analysis.entities}
-        related_relationships = 0
-
-        for rel in project_analysis.all_relationships:
-            if rel.source in file_entity_names or rel.target in file_entity_names:
-                related_relationships += 1
+        counts, indexed_files = self._file_relationship_counts(project_analysis)
+        if id(file_analysis) in indexed_files:
+            related_relationships = counts[id(file_analysis)]
+        else:
+            # File is not part of the project: scan its relationships directly
+            file_entity_names = file_analysis.entity_name_set
+            related_relationships = sum(
+                1 for rel in project_analysis.all_relationships
+                if rel.source in file_entity_names or rel.target in file_entity_names
+            )
 
         # Also count internal relationships
         internal_relationships = len(file_analysis.relationships)
@@ -252,17 +417,10 @@ class ContextScorer:
 
     def _calculate_relationship_density_entity(self, entity: Entity, file_analysis: FileAnalysis, project_analysis: 'ProjectAnalysis') -> float:
         """Calculate relationship density for an entity."""
-        # Count relationships where this entity is source or target
-        relationship_count = 0
-
-        for rel in file_analysis.relationships:
-            if rel.source == entity.name or rel.target == entity.name:
-                relationship_count += 1
-
-        # Also check cross-file relationships
-        for rel in project_analysis.all_relationships:
-            if rel.source == entity.name or rel.target == entity.name:
-                relationship_count += 1
+        # Count relationships where this entity is source or target, in the
+        # file and in cross-file relationships
+        file_counts, project_counts = self._entity_relationship_counts(file_analysis, project_analysis)
+        relationship_count = file_counts[entity.name] + project_counts[entity.name]
 
         # Normalize (higher count = higher density)
         density = min(relationship_count * 0.2, 1.0)
@@ -273,12 +431,19 @@ class ContextScorer:
         if not file_analysis.entities:
             return 0.0
 
-        entities_with_docstrings = sum(1 for e in file_analysis.entities if e.docstring)
-        coverage = entities_with_docstrings / len(file_analysis.entities)
+        # Docstring presence and total length in one pass over the entities
+        entities_with_docstrings = 0
+        total_length = 0
+        for e in file_analysis.entities:
+            if e.docstring:
+                entities_with_docstrings += 1
+                total_length += len(e.docstring)
+
+        entity_count = len(file_analysis.entities)
+        coverage = entities_with_docstrings / entity_count
 
         # Average docstring length (rough quality proxy)
-        total_length = sum(len(e.docstring or "") for e in file_analysis.entities)
-        avg_length = total_length / len(file_analysis.entities)
+        avg_length = total_length / entity_count
 
         length_score = min(avg_length * 0.001, 0.5)  # Cap at 0.5
 
@@ -288,38 +453,18 @@ class ContextScorer:
         """Calculate docstring quality for an entity."""
         if not entity.docstring:
             return 0.0
-
-        docstring = entity.docstring.strip()
-
-        # Length score
-        length_score = min(len(docstring) * 0.002, 0.6)  # Cap at 0.6
-
-        # Content quality heuristics
-        content_score = 0.0
-        if len(docstring.split()) > 5:  # More than 5 words
-            content_score += 0.2
-        if 'Args:' in docstring or 'Returns:' in docstring:  # Structured
-            content_score += 0.2
-        if any(term in docstring.lower() for term in ['function', 'class', 'method', 'calculate', 'create', 'validate']):
-            content_score += 0.2
-
-        return min(length_score + content_score, 1.0)
+        return _docstring_quality(entity.docstring)
 
     def _calculate_test_coverage_file(self, file_analysis: FileAnalysis) -> float:
         """Calculate test coverage heuristic for a file."""
-        file_path = Path(file_analysis.file_path)
-
-        # Check file path for test indicators
-        path_parts = file_path.parts
-        if any('test' in part.lower() for part in path_parts):
+        # Check file path for test indicators. Separators can't form 'test',
+        # so one search of the lowered path matches any('test' in part).
+        if 'test' in lower_text(file_analysis.file_path):
             return 0.8
 
-        # Check function names for test patterns
-        test_functions = sum(1 for e in file_analysis.entities
-                           if isinstance(e, Entity) and e.type == EntityType.FUNCTION
-                           and e.name.lower().startswith(('test_', 'test')))
-
-        if test_functions > 0:
+        # Check function names for test patterns ('test_' implies 'test')
+        if any(e.type == EntityType.FUNCTION and e.name[:4].lower() == 'test'
+               for e in file_analysis.entities):
             return 0.6
 
         return 0.0  # Unknown/unclear
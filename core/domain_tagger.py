@@ -13,10 +13,10 @@ Design:
 
 from dataclasses import dataclass, field
 from typing import List, Dict, Set, Optional
-from pathlib import Path
 import re
 
 from core.models import FileAnalysis, Entity, EntityType
+from core.text_prep import word_set
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -113,6 +113,34 @@ class DomainTagger:
         """Initialize tagger with compiled patterns."""
         self.concept_patterns = self._compile_concept_patterns()
 
+        # Every keyword is made of word characters only, so r'\bkw\b' matches
+        # exactly when kw is one of the text's \w+ runs. _tag_text uses this
+        # to test all keywords with one regex pass plus set lookups.
+        self._concept_keywords = [
+            (concept, [(kw, pattern.pattern) for kw, pattern in zip(keywords, patterns)])
+            for (concept, keywords), patterns in zip(
+                self.ACCOUNTING_CONCEPTS.items(), self.concept_patterns.values()
+            )
+        ]
+        self._all_keywords = frozenset(
+            kw for keywords in self.ACCOUNTING_CONCEPTS.values() for kw in keywords
+        )
+
+        # text -> ((concept, matched patterns), ...); the reasoning depends on
+        # the source, so only the matches are cached and tags are rebuilt
+        self._match_cache: Dict[str, tuple] = {}
+
+        # The path patterns are '.*lit1.*lit2.*' chains of literals; ASCII
+        # paths are checked with ordered substring searches instead of regex
+        self._path_literals = [
+            (pattern, pattern.pattern.strip(".*").split(".*"))
+            for pattern in self.ACCOUNTING_PATH_PATTERNS
+        ]
+
+        # (name, docstring) -> aggregated (concept, confidence, reasoning)
+        # rows; tag_entity only depends on these, and they recur across files
+        self._entity_cache: Dict[tuple, tuple] = {}
+
     def _compile_concept_patterns(self) -> Dict[str, List[re.Pattern]]:
         """Compile regex patterns for each accounting concept."""
         patterns = {}
@@ -134,44 +162,36 @@ class DomainTagger:
             DomainContext with tags and metadata
         """
         context = DomainContext()
-        file_path = Path(file_analysis.file_path)
+        file_path = file_analysis.path
         file_name = file_path.name.lower()
 
         # Check file path patterns
         path_reasons = []
-        for pattern in self.ACCOUNTING_PATH_PATTERNS:
-            if pattern.match(str(file_path)):
-                path_reasons.append(f"File path matches accounting pattern: {pattern.pattern}")
+        path_str = str(file_path)
+        for pattern in self._matching_path_patterns(path_str):
+            path_reasons.append(f"File path matches accounting pattern: {pattern.pattern}")
 
         if path_reasons:
             context.is_accounting_related = True
 
-        # Check file name for concepts
-        name_tags = self._tag_text(file_name, "file name")
-
-        # Check docstrings and names of entities
-        entity_tags = []
-        for entity in file_analysis.entities:
-            if entity.docstring:
-                doc_tags = self._tag_text(entity.docstring, f"docstring of {entity.name}")
-                entity_tags.extend(doc_tags)
-
-            # Tag entity names
-            name_tags.extend(self._tag_text(entity.name, f"name of {entity.name}"))
-
-        # Combine all tags
-        all_tags = name_tags + entity_tags
-
-        # Aggregate tags by concept
+        # Aggregate tags by concept, straight from the matches (no
+        # intermediate DomainTag per text). Order matters for the reasoning
+        # and tie-breaking: file name, entity names, then docstrings.
         tag_scores = {}
         tag_reasons = {}
 
-        for tag in all_tags:
-            if tag.tag not in tag_scores:
-                tag_scores[tag.tag] = 0
-                tag_reasons[tag.tag] = []
-            tag_scores[tag.tag] += tag.confidence
-            tag_reasons[tag.tag].extend(tag.reasoning)
+        # Check file name for concepts
+        self._accumulate_text(file_name, "file name", tag_scores, tag_reasons)
+
+        # Check names and docstrings of entities
+        entities = file_analysis.entities
+        for entity in entities:
+            self._accumulate_text(entity.name, f"name of {entity.name}", tag_scores, tag_reasons)
+        for entity in entities:
+            if entity.docstring:
+                self._accumulate_text(
+                    entity.docstring, f"docstring of {entity.name}", tag_scores, tag_reasons
+                )
 
         # Add path-based confidence boost
         if path_reasons:
@@ -200,6 +220,34 @@ class DomainTagger:
         logger.debug(f"Tagged {file_path.name}: {len(context.tags)} tags, primary: {context.primary_tag}")
         return context
 
+    def _matching_path_patterns(self, path_str: str) -> List[re.Pattern]:
+        """
+        Return the ACCOUNTING_PATH_PATTERNS that match a path, in order.
+
+        Args:
+            path_str: File path as a string
+
+        Returns:
+            Matching compiled patterns
+        """
+        # Non-ASCII (or multi-line) paths keep the regex: IGNORECASE folds
+        # some characters that str.lower() does not
+        if not path_str.isascii() or "\n" in path_str:
+            return [pattern for pattern in self.ACCOUNTING_PATH_PATTERNS if pattern.match(path_str)]
+
+        path_lower = path_str.lower()
+        matched = []
+        for pattern, literals in self._path_literals:
+            pos = 0
+            for literal in literals:
+                pos = path_lower.find(literal, pos)
+                if pos < 0:
+                    break
+                pos += len(literal)
+            else:
+                matched.append(pattern)
+        return matched
+
     def _tag_text(self, text: str, source: str) -> List[DomainTag]:
         """
         Tag text using concept patterns.
@@ -212,28 +260,78 @@ class DomainTagger:
             List of domain tags found
         """
         tags = []
-        text_lower = text.lower()
+        for concept, matches in self._cached_matches(text):
+            tags.append(DomainTag(
+                tag=concept,
+                confidence=self._match_confidence(matches),
+                reasoning=[self._match_reasoning(matches, source)]
+            ))
 
-        for concept, patterns in self.concept_patterns.items():
-            matches = []
-            for pattern in patterns:
-                if pattern.search(text_lower):
-                    matches.append(pattern.pattern)
+        return tags
 
-            if matches:
-                # Calculate confidence based on number of matches
-                confidence = min(len(matches) * 0.2, 0.8)  # Max 0.8 for text matches
-                reasoning = [f"Found {len(matches)} keyword matches in {source}: {', '.join(matches[:3])}"]
-                if len(matches) > 3:
-                    reasoning[0] += f" (and {len(matches)-3} more)"
+    def _accumulate_text(self, text: str, source: str,
+                         tag_scores: Dict[str, float], tag_reasons: Dict[str, List[str]]) -> None:
+        """
+        Add the concept matches of text into running per-concept totals.
 
-                tags.append(DomainTag(
-                    tag=concept,
-                    confidence=confidence,
-                    reasoning=reasoning
-                ))
+        Args:
+            text: Text to analyze
+            source: Description of text source for reasoning
+            tag_scores: Concept -> summed confidence, updated in place
+            tag_reasons: Concept -> reasoning strings, updated in place
+        """
+        for concept, matches in self._cached_matches(text):
+            if concept not in tag_scores:
+                tag_scores[concept] = 0
+                tag_reasons[concept] = []
+            tag_scores[concept] += self._match_confidence(matches)
+            tag_reasons[concept].append(self._match_reasoning(matches, source))
+
+    @staticmethod
+    def _match_confidence(matches: tuple) -> float:
+        """Confidence based on number of matches (max 0.8 for text matches)."""
+        return min(len(matches) * 0.2, 0.8)
+
+    @staticmethod
+    def _match_reasoning(matches: tuple, source: str) -> str:
+        """Reasoning string for the keyword matches found in source."""
+        reason = f"Found {len(matches)} keyword matches in {source}: {', '.join(matches[:3])}"
+        if len(matches) > 3:
+            reason += f" (and {len(matches)-3} more)"
+        return reason
+
+    def _cached_matches(self, text: str) -> tuple:
+        """Return _match_concepts(text), computed once per distinct text."""
+        matches_by_concept = self._match_cache.get(text)
+        if matches_by_concept is None:
+            matches_by_concept = self._match_concepts(text)
+            self._match_cache[text] = matches_by_concept
+        return matches_by_concept
+
+    def _match_concepts(self, text: str) -> tuple:
+        """
+        Find the keyword patterns of each concept that match text.
 
-        return tags
+        Args:
+            text: Text to analyze
+
+        Returns:
+            Tuple of (concept, tuple of matched patterns) for matching concepts
+        """
+        # word_set is memoized: entity names and docstrings are tagged by both
+        # tag_file and tag_entity, and are shared with the context scorer
+        words = word_set(text)
+
+        # Fast path: most texts contain no keyword at all
+        if self._all_keywords.isdisjoint(words):
+            return ()
+
+        result = []
+        for concept, keywords in self._concept_keywords:
+            matches = tuple(pattern for kw, pattern in keywords if kw in words)
+            if matches:
+                result.append((concept, matches))
+        return tuple(result)
 
     def tag_entity(self, entity: Entity) -> DomainContext:
         """
@@ -245,42 +343,44 @@ class DomainTagger:
         Returns:
             DomainContext for the entity
         """
-        context = DomainContext()
+        key = (entity.name, entity.docstring)
+        rows = self._entity_cache.get(key)
+        if rows is None:
+            rows = self._aggregate_entity_tags(entity)
+            self._entity_cache[key] = rows
+
+        # Fresh objects per call: callers own (and may mutate) the context
+        context = DomainContext(tags=[
+            DomainTag(tag=concept, confidence=confidence, reasoning=list(reasoning))
+            for concept, confidence, reasoning in rows
+        ])
+        if context.tags:
+            context.primary_tag = context.tags[0].tag
+            context.is_accounting_related = True
 
-        # Tag based on name
-        name_tags = self._tag_text(entity.name, "entity name")
+        return context
 
-        # Tag based on docstring
-        doc_tags = []
-        if entity.docstring:
-            doc_tags = self._tag_text(entity.docstring, "docstring")
+    def _aggregate_entity_tags(self, entity: Entity) -> tuple:
+        """
+        Compute an entity's aggregated tags, sorted by confidence.
 
-        # Combine
-        all_tags = name_tags + doc_tags
+        Args:
+            entity: The entity to tag
 
-        # Aggregate as above
+        Returns:
+            Tuple of (concept, confidence, reasoning tuple) rows
+        """
+        # Aggregate as in tag_file: name first, then docstring
         tag_scores = {}
         tag_reasons = {}
+        self._accumulate_text(entity.name, "entity name", tag_scores, tag_reasons)
+        if entity.docstring:
+            self._accumulate_text(entity.docstring, "docstring", tag_scores, tag_reasons)
 
-        for tag in all_tags:
-            if tag.tag not in tag_scores:
-                tag_scores[tag.tag] = 0
-                tag_reasons[tag.tag] = []
-            tag_scores[tag.tag] += tag.confidence
-            tag_reasons[tag.tag].extend(tag.reasoning)
-
-        for concept, score in tag_scores.items():
-            confidence = min(score, 1.0)
-            if confidence >= 0.1:
-                context.tags.append(DomainTag(
-                    tag=concept,
-                    confidence=confidence,
-                    reasoning=tag_reasons[concept]
-                ))
-
-        context.tags.sort(key=lambda t: t.confidence, reverse=True)
-        if context.tags:
-            context.primary_tag = context.tags[0].tag
-            context.is_accounting_related = True
-
-        return context
+        rows = [
+            (concept, min(score, 1.0), tuple(tag_reasons[concept]))
+            for concept, score in tag_scores.items()
+            if min(score, 1.0) >= 0.1
+        ]
+        rows.sort(key=lambda row: row[1], reverse=True)
+        return tuple(rows)
@@ -5,6 +5,9 @@ Design Rationale:
 - Use standard library dataclasses (no external dependencies)
 - Represent all code entities extracted from AST
 - Immutable/frozen dataclasses for integrity
+- Per-entity classes use __slots__ (no per-instance __dict__): a project
+  produces tens of thousands of them. FileAnalysis/ProjectAnalysis keep a
+  __dict__ for their lazily cached views (and weakrefs)
 - Easy conversion to dict/JSON (for API responses later)
 - Type hints throughout for IDE support and validation
 
@@ -14,8 +17,9 @@ These models form the core vocabulary of the entire platform:
 """
 
 from dataclasses import dataclass, field, asdict
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, FrozenSet, Tuple
 from enum import Enum
+from pathlib import Path
 
 
 class EntityType(str, Enum):
@@ -28,6 +32,13 @@ class EntityType(str, Enum):
     ASYNC_FUNCTION = "async_function"
 
 
+# Enum member lookups (EntityType.X) go through the enum metaclass; the
+# per-entity __post_init__ checks compare against these module constants
+_FUNCTION_TYPES = frozenset({EntityType.FUNCTION, EntityType.ASYNC_FUNCTION})
+_CLASS_TYPE = EntityType.CLASS
+_IMPORT_TYPE = EntityType.IMPORT
+
+
 class RelationType(str, Enum):
     """Types of relationships between entities."""
     CALLS = "calls"
@@ -38,7 +49,7 @@ class RelationType(str, Enum):
     DEPENDS_ON = "depends_on"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Location:
     """
     Location of an entity in source code.
@@ -59,7 +70,17 @@ class Location:
         return f"{self.file_path}:{self.line_start}"
 
 
-@dataclass(frozen=True)
+def _location_to_dict(location: Location) -> Dict[str, Any]:
+    """Serialize a Location (the nested "location" of Entity.to_dict)."""
+    return {
+        "file_path": location.file_path,
+        "line_start": location.line_start,
+        "line_end": location.line_end,
+        "column_start": location.column_start,
+    }
+
+
+@dataclass(frozen=True, slots=True)
 class Entity:
     """
     Base class for all code entities (functions, classes, etc.).
@@ -83,55 +104,65 @@ class Entity:
         """Convert entity to dictionary (for JSON serialization)."""
         return {
             "name": self.name,
-            "type": self.type.value,
-            "location": {
-                "file_path": self.location.file_path,
-                "line_start": self.location.line_start,
-                "line_end": self.location.line_end,
-                "column_start": self.location.column_start,
-            },
+            # _value_ is the plain attribute behind the .value descriptor
+            "type": self.type._value_,
+            "location": _location_to_dict(self.location),
             "docstring": self.docstring,
             "source_code": self.source_code,
             "metadata": self.metadata,
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Function(Entity):
     """Represents a function or method."""
     
-    def __post_init__(self):
-        """Validate that entity type is a function variant."""
-        if self.type not in (EntityType.FUNCTION, EntityType.ASYNC_FUNCTION):
-            raise ValueError(f"Function entity must have function type, got {self.type}")
+    # Type checks are debug-only: under python -O the classes define no
+    # __post_init__, so dataclass __init__ skips the call entirely
+    if __debug__:
+        def __post_init__(self):
+            """Validate that entity type is a function variant."""
+            if self.type not in _FUNCTION_TYPES:
+                raise ValueError(f"Function entity must have function type, got {self.type}")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Class(Entity):
     """
     Represents a class definition.
     
     Attributes:
-        methods: List of methods in this class
+        methods: Methods in this class
         base_classes: Names of parent classes
     """
-    methods: List[Function] = field(default_factory=list)
-    base_classes: List[str] = field(default_factory=list)
+    # Tuples keep the frozen class actually immutable and are smaller than
+    # lists; classes without bases or methods all share ()
+    methods: Tuple[Function, ...] = ()
+    base_classes: Tuple[str, ...] = ()
     
-    def __post_init__(self):
-        """Validate that entity type is CLASS."""
-        if self.type != EntityType.CLASS:
-            raise ValueError(f"Class entity must have CLASS type, got {self.type}")
+    if __debug__:
+        def __post_init__(self):
+            """Validate that entity type is CLASS."""
+            if self.type != _CLASS_TYPE:
+                raise ValueError(f"Class entity must have CLASS type, got {self.type}")
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert class to dictionary including methods."""
-        d = super().to_dict()
-        d["methods"] = [m.to_dict() for m in self.methods]
-        d["base_classes"] = self.base_classes
-        return d
+        # Single literal (same keys and order as Entity.to_dict + extras)
+        # rather than building the base dict and then growing it
+        return {
+            "name": self.name,
+            "type": self.type._value_,
+            "location": _location_to_dict(self.location),
+            "docstring": self.docstring,
+            "source_code": self.source_code,
+            "metadata": self.metadata,
+            "methods": [m.to_dict() for m in self.methods],
+            "base_classes": list(self.base_classes),
+        }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Import(Entity):
     """
     Represents an import statement.
@@ -145,21 +176,28 @@ class Import(Entity):
     alias: Optional[str] = None
     is_from: bool = False
     
-    def __post_init__(self):
-        """Validate that entity type is IMPORT."""
-        if self.type != EntityType.IMPORT:
-            raise ValueError(f"Import entity must have IMPORT type, got {self.type}")
+    if __debug__:
+        def __post_init__(self):
+            """Validate that entity type is IMPORT."""
+            if self.type != _IMPORT_TYPE:
+                raise ValueError(f"Import entity must have IMPORT type, got {self.type}")
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert import to dictionary."""
-        d = super().to_dict()
-        d["module"] = self.module
-        d["alias"] = self.alias
-        d["is_from"] = self.is_from
-        return d
+        return {
+            "name": self.name,
+            "type": self.type._value_,
+            "location": _location_to_dict(self.location),
+            "docstring": self.docstring,
+            "source_code": self.source_code,
+            "metadata": self.metadata,
+            "module": self.module,
+            "alias": self.alias,
+            "is_from": self.is_from,
+        }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Relationship:
     """
     Represents a relationship between two code entities.
@@ -182,7 +220,7 @@ class Relationship:
         return {
             "source": self.source,
             "target": self.target,
-            "type": self.type.value,
+            "type": self.type._value_,
             "source_location": {
                 "file_path": self.source_location.file_path,
                 "line_start": self.source_location.line_start,
@@ -210,23 +248,74 @@ class FileAnalysis:
     relationships: List[Relationship] = field(default_factory=list)
     errors: List[str] = field(default_factory=list)
     
+    def _entity_views(self) -> tuple:
+        """
+        (imports, functions, classes), split in one pass over entities.
+
+        Cached; rebuilt if entities is replaced or resized. The cache holds
+        the list itself (an id() could be reused once the list is freed).
+        The lists are shared between calls, so callers must not mutate them.
+        """
+        entities = self.entities
+        cached = getattr(self, "_entity_views_cache", None)
+        if cached is None or cached[0] is not entities or cached[1] != len(entities):
+            imports, functions, classes = [], [], []
+            for e in entities:
+                if isinstance(e, Function):
+                    functions.append(e)
+                elif isinstance(e, Class):
+                    classes.append(e)
+                elif isinstance(e, Import):
+                    imports.append(e)
+            cached = (entities, len(entities), (imports, functions, classes))
+            self._entity_views_cache = cached
+        return cached[2]
+    
     @property
     def imports(self) -> List[Import]:
         """Get all imports from entities."""
-        return [e for e in self.entities if isinstance(e, Import)]
+        return self._entity_views()[0]
     
     @property
     def functions(self) -> List[Function]:
         """Get all functions from entities."""
-        return [e for e in self.entities if isinstance(e, Function)]
+        return self._entity_views()[1]
     
     @property
     def classes(self) -> List[Class]:
         """Get all classes from entities."""
-        return [e for e in self.entities if isinstance(e, Class)]
+        return self._entity_views()[2]
+    
+    @property
+    def entity_name_set(self) -> FrozenSet[str]:
+        """
+        Names of all entities, as a set.
+
+        Cached on first access; rebuilt if entities is replaced or resized.
+        """
+        entities = self.entities
+        cached = getattr(self, "_entity_name_cache", None)
+        if cached is None or cached[0] is not entities or cached[1] != len(entities):
+            cached = (entities, len(entities), frozenset(e.name for e in entities))
+            self._entity_name_cache = cached
+        return cached[2]
+    
+    @property
+    def path(self) -> Path:
+        """
+        file_path as a Path.
+
+        Cached on first access; rebuilt if file_path is reassigned.
+        """
+        cached = getattr(self, "_path_cache", None)
+        if cached is None or cached[0] is not self.file_path:
+            cached = (self.file_path, Path(self.file_path))
+            self._path_cache = cached
+        return cached[1]
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert analysis to dictionary."""
+        imports, functions, classes = self._entity_views()
         return {
             "file_path": self.file_path,
             "entities": [e.to_dict() for e in self.entities],
@@ -234,9 +323,9 @@ class FileAnalysis:
             "errors": self.errors,
             "summary": {
                 "total_entities": len(self.entities),
-                "functions": len(self.functions),
-                "classes": len(self.classes),
-                "imports": len(self.imports),
+                "functions": len(functions),
+                "classes": len(classes),
+                "imports": len(imports),
                 "relationships": len(self.relationships),
             }
         }
@@ -258,23 +347,62 @@ class ProjectAnalysis:
     all_relationships: List[Relationship] = field(default_factory=list)
     errors: List[str] = field(default_factory=list)
     
+    def _entity_views(self) -> tuple:
+        """
+        (entities, functions, classes) across all files.
+
+        Cached; rebuilt if file_analyses is replaced or resized, or a file's
+        entities list is replaced or resized (an O(files) check). The cache
+        holds the lists themselves, as in FileAnalysis._entity_views. The
+        lists are shared between calls, so callers must not mutate them.
+        """
+        file_analyses = self.file_analyses
+        cached = getattr(self, "_entity_views_cache", None)
+        if (
+            cached is None
+            or cached[0] is not file_analyses
+            or len(cached[1]) != len(file_analyses)
+            or not all(
+                file_entities is fa.entities and size == len(file_entities)
+                for (file_entities, size), fa in zip(cached[1], file_analyses)
+            )
+        ):
+            entities, functions, classes = [], [], []
+            for fa in file_analyses:
+                entities.extend(fa.entities)
+                _, file_functions, file_classes = fa._entity_views()
+                functions.extend(file_functions)
+                classes.extend(file_classes)
+            entity_lists = [(fa.entities, len(fa.entities)) for fa in file_analyses]
+            cached = (file_analyses, entity_lists, (entities, functions, classes))
+            self._entity_views_cache = cached
+        return cached[2]
+    
     @property
     def all_entities(self) -> List[Entity]:
         """Get all entities from all files."""
-        entities = []
-        for fa in self.file_analyses:
-            entities.extend(fa.entities)
-        return entities
+        return self._entity_views()[0]
     
     @property
     def all_functions(self) -> List[Function]:
         """Get all functions from all files."""
-        return [e for e in self.all_entities if isinstance(e, Function)]
+        return self._entity_views()[1]
     
     @property
     def all_classes(self) -> List[Class]:
         """Get all classes from all files."""
-        return [e for e in self.all_entities if isinstance(e, Class)]
+        return self._entity_views()[2]
+    
+    def summary(self) -> Dict[str, int]:
+        """Project-wide counts (the "summary" block of to_dict)."""
+        entities, functions, classes = self._entity_views()
+        return {
+            "total_files": len(self.file_analyses),
+            "total_entities": len(entities),
+            "total_functions": len(functions),
+            "total_classes": len(classes),
+            "total_relationships": len(self.all_relationships),
+        }
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert project analysis to dictionary."""
@@ -283,11 +411,5 @@ class ProjectAnalysis:
             "file_analyses": [fa.to_dict() for fa in self.file_analyses],
             "all_relationships": [r.to_dict() for r in self.all_relationships],
             "errors": self.errors,
-            "summary": {
-                "total_files": len(self.file_analyses),
-                "total_entities": len(self.all_entities),
-                "total_functions": len(self.all_functions),
-                "total_classes": len(self.all_classes),
-                "total_relationships": len(self.all_relationships),
-            }
+            "summary": self.summary(),
         }
@@ -0,0 +1,87 @@
+"""
+On-disk cache of parsed files for incremental re-analysis.
+
+Design:
+- Opt-in: used only when a cache directory is configured (PARSE_CACHE_DIR)
+- Keyed by resolved path + (st_mtime_ns, st_size), so any edit invalidates
+- One pickle per source file, named by a hash of its path
+- Entries also record a format version and the Python version, since both
+  change what the parser produces
+- Writes go through a temp file + os.replace, so parallel workers never
+  read a partial entry
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from typing import Callable
+
+from core.models import FileAnalysis
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Bump whenever the parser's output for the same source changes
+_CACHE_VERSION = 1
+
+
+def parse_with_cache(
+    file_path: str, cache_dir: str, parse: Callable[[str], FileAnalysis]
+) -> FileAnalysis:
+    """
+    Return the cached FileAnalysis for file_path, or parse and cache it.
+
+    Results with errors are not cached: they may depend on configuration
+    (e.g. MAX_FILE_SIZE_MB) rather than on the file alone.
+
+    Args:
+        file_path: Path to the Python file
+        cache_dir: Directory holding the cache entries
+        parse: Parser to call on a miss (e.g. SafeParser.parse_file)
+
+    Returns:
+        FileAnalysis for the file
+    """
+    path = os.path.realpath(file_path)
+    try:
+        st = os.stat(path)
+    except OSError:
+        return parse(file_path)  # Let the parser report the problem
+
+    key = (_CACHE_VERSION, sys.version_info[:2], path, st.st_mtime_ns, st.st_size)
+    digest = hashlib.sha1(path.encode("utf-8", "surrogatepass")).hexdigest()
+    entry_path = os.path.join(cache_dir, digest + ".pkl")
+
+    try:
+        with open(entry_path, "rb") as f:
+            cached_key, analysis = pickle.load(f)
+        if cached_key == key:
+            return analysis
+    except FileNotFoundError:
+        pass
+    except Exception as e:  # Corrupt or written by an incompatible version
+        logger.debug(f"Ignoring unreadable parse cache entry {entry_path}: {e}")
+
+    analysis = parse(file_path)
+    if not analysis.errors:
+        _store(entry_path, key, analysis)
+    return analysis
+
+
+def _store(entry_path: str, key: tuple, analysis: FileAnalysis) -> None:
+    """Atomically write a cache entry; failures only cost the cache hit."""
+    cache_dir = os.path.dirname(entry_path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((key, analysis), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, entry_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except Exception as e:
+        logger.warning(f"Could not write parse cache entry {entry_path}: {e}")
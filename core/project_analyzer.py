@@ -10,24 +10,28 @@ Design Rationale:
 
 Architecture Pattern:
 - ProjectAnalyzer: Main class for project traversal and aggregation
-- Uses os.walk for directory traversal with ignore patterns
+- Uses os.scandir for directory traversal with ignore patterns
 - Leverages SafeParser for individual file analysis
 - Builds cross-file relationships (imports, calls, dependencies)
 """
 
 import os
-import json
 from pathlib import Path
-from typing import List, Optional
+from collections import defaultdict
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional
 
-from core.models import ProjectAnalysis, FileAnalysis, Relationship
+from core.models import ProjectAnalysis, FileAnalysis, Import, Relationship
 from core.ast_parser import SafeParser
 from core.semantic_index import SemanticIndexer, SemanticIndex
 from utils.logger import get_logger
 from utils.config import Config
+from utils.json_encoding import encode_json
 
 logger = get_logger(__name__)
 
+# Root of this analyzer's own source tree, resolved once at import
+_ANALYZER_REPO_ROOT = Path(__file__).resolve().parents[1]
+
 
 class ProjectAnalyzer:
     """
@@ -41,16 +45,26 @@ class ProjectAnalyzer:
     - JSON output for indexing and RAG
     """
 
-    def __init__(self, root_path: str, project_name: Optional[str] = None):
+    def __init__(
+        self,
+        root_path: str,
+        project_name: Optional[str] = None,
+        verbose: bool = False,
+    ):
         """
         Initialize project analyzer.
 
         Args:
             root_path: Root directory path to analyze (legacy code only)
             project_name: Optional project name (defaults to directory name)
+            verbose: Print a progress line per analyzed file
         """
         self.root_path = Path(root_path).resolve()
         self.project_name = project_name or self.root_path.name
+        self.verbose = verbose
+
+        # Errors for files collect_python_files() skipped as too large
+        self.skipped_file_errors: List[str] = []
 
         # Ignore patterns (configurable + defaults)
         self.ignore_patterns = set(Config.ignore_patterns())
@@ -64,8 +78,7 @@ class ProjectAnalyzer:
         })
 
         # SAFETY CHECK: prevent analyzing analyzer source itself
-        repo_root = Path(__file__).resolve().parents[1]
-        if self.root_path == repo_root or repo_root in self.root_path.parents:
+        if self.root_path.is_relative_to(_ANALYZER_REPO_ROOT):
             logger.warning(
                 "Root path appears to include analyzer source code. "
                 "Expected an external legacy code directory."
@@ -86,27 +99,28 @@ class ProjectAnalyzer:
         logger.info(f"Starting project analysis: {self.project_name}")
 
         project_analysis = ProjectAnalysis(project_name=self.project_name)
-        file_paths = self._collect_python_files()
+        file_paths = self.collect_python_files()
+        project_analysis.errors.extend(self.skipped_file_errors)
 
         logger.info(f"Found {len(file_paths)} Python files to analyze")
 
-        for index, file_path in enumerate(file_paths, start=1):
-            logger.info(f"Analyzing file {index}/{len(file_paths)}: {file_path}")
-            print(f"  → Analyzing {index}/{len(file_paths)}: {Path(file_path).name}")
-
-            try:
-                file_analysis = SafeParser.parse_file(file_path)
+        # Serial unless PARSE_WORKERS > 1; results arrive in order
+        results = SafeParser.iter_parse_files(
+            file_paths,
+            max_workers=Config.parse_workers(),
+            cache_dir=Config.parse_cache_dir(),
+        )
 
-                project_analysis.file_analyses.append(file_analysis)
+        for index, (file_path, file_analysis) in enumerate(zip(file_paths, results), start=1):
+            logger.info(f"Analyzed file {index}/{len(file_paths)}: {file_path}")
+            if self.verbose:
+                print(f"  → Analyzed {index}/{len(file_paths)}: {os.path.basename(file_path)}")
 
-                if file_analysis.errors:
-                    project_analysis.errors.extend(file_analysis.errors)
-                    logger.warning(f"Errors in {file_path}: {file_analysis.errors}")
+            project_analysis.file_analyses.append(file_analysis)
 
-            except Exception as exc:
-                error_msg = f"Failed to analyze {file_path}: {exc}"
-                project_analysis.errors.append(error_msg)
-                logger.error(error_msg)
+            if file_analysis.errors:
+                project_analysis.errors.extend(file_analysis.errors)
+                logger.warning(f"Errors in {file_path}: {file_analysis.errors}")
 
         # Build cross-file relationships
         logger.info("Building cross-file relationships")
@@ -119,34 +133,62 @@ class ProjectAnalyzer:
         )
         return project_analysis
 
-    def _collect_python_files(self) -> List[str]:
+    def collect_python_files(self) -> List[str]:
         """
         Recursively collect all Python files in the project,
         respecting ignore patterns.
 
+        Uses os.scandir so directory entries carry their type from the
+        listing; files over Config.max_file_size_mb() are skipped here
+        instead of being read and rejected by the parser, with an error
+        for each recorded in self.skipped_file_errors.
+
         Returns:
             List of absolute paths to Python files
         """
         python_files: List[str] = []
+        skipped_file_errors = self.skipped_file_errors = []
 
-        for root, dirs, files in os.walk(self.root_path):
-            root_path = Path(root)
+        if self._should_ignore(self.root_path):
+            return python_files
 
-            # Skip ignored directories
-            dirs[:] = [
-                d for d in dirs
-                if not self._should_ignore(root_path / d)
-            ]
+        max_size = Config.max_file_size_mb() * 1024 * 1024
+        ignore_patterns = self.ignore_patterns
 
-            # Skip ignored roots
-            if self._should_ignore(root_path):
+        # Depth-first, same visiting order as os.walk(topdown=True)
+        stack = [str(self.root_path)]
+        while stack:
+            directory = stack.pop()
+            subdirs = []
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        # Parents were already checked, so only the name matters
+                        if name in ignore_patterns or name.startswith("."):
+                            continue
+                        if entry.is_dir():
+                            if not entry.is_symlink():
+                                subdirs.append(entry.path)
+                        elif name.endswith(".py"):
+                            try:
+                                size = entry.stat().st_size
+                            except OSError:
+                                size = 0  # Let SafeParser report the problem
+                            if size > max_size:
+                                error_msg = (
+                                    f"Skipped {entry.path}: file exceeds maximum size "
+                                    f"({Config.max_file_size_mb()} MB)"
+                                )
+                                skipped_file_errors.append(error_msg)
+                                logger.warning(error_msg)
+                                continue
+                            python_files.append(entry.path)
+            except OSError as exc:
+                logger.warning(f"Cannot read directory {directory}: {exc}")
                 continue
 
-            for file in files:
-                if file.endswith(".py"):
-                    file_path = root_path / file
-                    if not self._should_ignore(file_path):
-                        python_files.append(str(file_path))
+            stack.extend(reversed(subdirs))
 
         return python_files
 
@@ -183,32 +225,43 @@ class ProjectAnalyzer:
             List of cross-file relationships
         """
         relationships: List[Relationship] = []
-        entity_map = {}  # entity_name -> (file_path, entity)
+        append = relationships.append
 
-        # Build entity lookup
+        # name -> files defining a function/class of that name, in file
+        # order. Imports are not definitions: indexing them would point
+        # edges at every file that merely imports the name.
+        files_by_name: Dict[str, List[str]] = defaultdict(list)
         for fa in file_analyses:
-            for entity in fa.entities:
-                entity_map[entity.name] = (fa.file_path, entity)
+            file_path = fa.file_path
+            for name in {e.name for e in fa.entities if not isinstance(e, Import)}:
+                files_by_name[name].append(file_path)
 
         # Build cross-file relationships
         for fa in file_analyses:
+            file_path = fa.file_path
             for rel in fa.relationships:
-                if rel.target in entity_map:
-                    target_file, _ = entity_map[rel.target]
-                    if target_file != fa.file_path:
-                        cross_rel = Relationship(
-                            source=f"{fa.file_path}::{rel.source}",
-                            target=f"{target_file}::{rel.target}",
-                            type=rel.type,
-                            source_location=rel.source_location,
-                            metadata={
-                                **rel.metadata,
-                                "cross_file": True,
-                                "source_file": fa.file_path,
-                                "target_file": target_file,
-                            },
-                        )
-                        relationships.append(cross_rel)
+                target_files = files_by_name.get(rel.target)
+                # A definition in the same file shadows the others
+                if not target_files or file_path in target_files:
+                    continue
+                source = f"{file_path}::{rel.source}"
+                target_name = rel.target
+                rel_type = rel.type
+                source_location = rel.source_location
+                rel_metadata = rel.metadata
+                # A name defined in several files gets an edge to each
+                for target_file in target_files:
+                    metadata = rel_metadata.copy()
+                    metadata["cross_file"] = True
+                    metadata["source_file"] = file_path
+                    metadata["target_file"] = target_file
+                    append(Relationship(
+                        source=source,
+                        target=f"{target_file}::{target_name}",
+                        type=rel_type,
+                        source_location=source_location,
+                        metadata=metadata,
+                    ))
 
         logger.info(f"Built {len(relationships)} cross-file relationships")
         return relationships
@@ -233,13 +286,10 @@ class ProjectAnalyzer:
 
         output_path = Path(output_path).resolve()
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(
-                project_analysis.to_dict(),
-                f,
-                indent=2,
-                ensure_ascii=False,
-            )
+        # Streamed one file / relationship at a time, so peak memory is one
+        # entry's dict rather than the whole project's to_dict() tree
+        with open(output_path, "wb") as f:
+            _write_analysis_json(f, project_analysis)
 
         logger.info(f"Saved project analysis to {output_path}")
         return str(output_path)
@@ -282,10 +332,34 @@ class ProjectAnalyzer:
         return output_path
 
 
+def _write_analysis_json(f: BinaryIO, project_analysis: ProjectAnalysis) -> None:
+    """
+    Write ProjectAnalysis.to_dict() as indented JSON without building it.
+
+    Output is byte-identical to json.dump(project_analysis.to_dict(), f,
+    indent=2, ensure_ascii=False), encoded as UTF-8.
+    """
+    def write_list(key: str, items: Iterable[Dict[str, Any]]) -> None:
+        f.write(b'  "' + key.encode() + b'": [')
+        first = True
+        for item in items:
+            f.write(b"\n    " if first else b",\n    ")
+            f.write(encode_json(item, 2))
+            first = False
+        f.write(b"],\n" if first else b"\n  ],\n")
+
+    f.write(b'{\n  "project_name": ' + encode_json(project_analysis.project_name, 1) + b",\n")
+    write_list("file_analyses", (fa.to_dict() for fa in project_analysis.file_analyses))
+    write_list("all_relationships", (r.to_dict() for r in project_analysis.all_relationships))
+    f.write(b'  "errors": ' + encode_json(project_analysis.errors, 1) + b",\n")
+    f.write(b'  "summary": ' + encode_json(project_analysis.summary(), 1) + b"\n}")
+
+
 def analyze_project(
     root_path: str,
     project_name: Optional[str] = None,
     save_output: bool = True,
+    verbose: bool = False,
 ) -> ProjectAnalysis:
     """
     Convenience function to analyze an entire project.
@@ -294,11 +368,12 @@ def analyze_project(
         root_path: Root directory of legacy code
         project_name: Optional project name
         save_output: Whether to save JSON output
+        verbose: Print a progress line per analyzed file
 
     Returns:
         ProjectAnalysis object
     """
-    analyzer = ProjectAnalyzer(root_path, project_name)
+    analyzer = ProjectAnalyzer(root_path, project_name, verbose=verbose)
     analysis = analyzer.analyze_project()
 
     if save_output:
@@ -312,6 +387,7 @@ def analyze_project_with_semantic(
     root_path: str,
     project_name: Optional[str] = None,
     save_output: bool = True,
+    verbose: bool = False,
 ) -> tuple[ProjectAnalysis, SemanticIndex]:
     """
     Convenience function to analyze project with semantic indexing.
@@ -320,11 +396,12 @@ def analyze_project_with_semantic(
         root_path: Root directory of legacy code
         project_name: Optional project name
         save_output: Whether to save JSON outputs
+        verbose: Print a progress line per analyzed file
 
     Returns:
         Tuple of (ProjectAnalysis, SemanticIndex)
     """
-    analyzer = ProjectAnalyzer(root_path, project_name)
+    analyzer = ProjectAnalyzer(root_path, project_name, verbose=verbose)
     analysis = analyzer.analyze_project()
     semantic_index = analyzer.build_semantic_index(analysis)
 
@@ -11,9 +11,14 @@ Design:
 - Support for workflow-aware searches
 """
 
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Set
+from functools import lru_cache
+from operator import itemgetter
+from typing import List, Dict, FrozenSet, Optional, Set, Tuple
+import heapq
 import re
+import sys
 from pathlib import Path
 
 from core.semantic_index import SemanticIndex, SemanticEntity, SemanticFile
@@ -22,6 +27,10 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Name parts: acronyms (HTTP in HTTPServer), capitalized or lowercase words,
+# and digit runs; underscores and other separators are skipped
+_NAME_TOKEN_RE = re.compile(r"[A-Z]+(?![a-z])|[A-Z][a-z]*|[a-z]+|[0-9]+")
+
 
 @dataclass
 class QueryResult:
@@ -69,36 +78,50 @@ class SemanticQueryEngine:
 
     def _build_search_structures(self):
         """Build internal data structures for fast querying."""
-        self.entity_search_terms: Dict[str, Set[str]] = {}
-        self.file_search_terms: Dict[str, Set[str]] = {}
+        self.entity_search_terms: Dict[str, FrozenSet[str]] = {}
+        self.file_search_terms: Dict[str, FrozenSet[str]] = {}
+
+        # Inverted index (term -> entity keys), so a query only scores the
+        # entities sharing a term with it. Positions restore index order.
+        self.term_to_entities: Dict[str, Set[str]] = defaultdict(set)
+        self._entity_positions: Dict[str, int] = {}
+
+        # Per-entity inputs of _calculate_entity_relevance that do not depend
+        # on the query (see _relevance_features)
+        self._entity_features: Dict[str, Tuple[str, Optional[str], float, float]] = {}
 
         # Build entity search terms
-        for entity_key, entity in self.index.entities.items():
+        for position, (entity_key, entity) in enumerate(self.index.entities.items()):
             terms = self._extract_search_terms_entity(entity)
             self.entity_search_terms[entity_key] = terms
+            self._entity_positions[entity_key] = position
+            self._entity_features[entity_key] = _relevance_features(entity)
+            for term in terms:
+                self.term_to_entities[term].add(entity_key)
 
         # Build file search terms
         for file_path, file_info in self.index.files.items():
             terms = self._extract_search_terms_file(file_path, file_info)
             self.file_search_terms[file_path] = terms
 
-    def _extract_search_terms_entity(self, entity: SemanticEntity) -> Set[str]:
+    def _extract_search_terms_entity(self, entity: SemanticEntity) -> FrozenSet[str]:
         """Extract searchable terms from an entity."""
         terms = set()
 
         # Add name tokens
         terms.update(self._tokenize_name(entity.name))
 
-        # Add domain tags
-        terms.update(tag.tag.lower() for tag in entity.domain_context.tags)
+        # Add domain tags. Terms are interned throughout (names, tags and
+        # query tokens), so matching lookups compare by identity.
+        terms.update(sys.intern(tag.tag.lower()) for tag in entity.domain_context.tags)
 
         # Add docstring tokens (if present)
         if entity.domain_context.primary_tag:
-            terms.add(entity.domain_context.primary_tag.lower())
+            terms.add(sys.intern(entity.domain_context.primary_tag.lower()))
 
-        return terms
+        return frozenset(terms)
 
-    def _extract_search_terms_file(self, file_path: str, file_info: SemanticFile) -> Set[str]:
+    def _extract_search_terms_file(self, file_path: str, file_info: SemanticFile) -> FrozenSet[str]:
         """Extract searchable terms from a file."""
         terms = set()
 
@@ -107,30 +130,17 @@ class SemanticQueryEngine:
         terms.update(self._tokenize_name(path_obj.name))
 
         # Add domain tags
-        terms.update(tag.tag.lower() for tag in file_info.domain_context.tags)
+        terms.update(sys.intern(tag.tag.lower()) for tag in file_info.domain_context.tags)
 
         # Add primary tag
         if file_info.domain_context.primary_tag:
-            terms.add(file_info.domain_context.primary_tag.lower())
+            terms.add(sys.intern(file_info.domain_context.primary_tag.lower()))
 
-        return terms
+        return frozenset(terms)
 
-    def _tokenize_name(self, name: str) -> Set[str]:
+    def _tokenize_name(self, name: str) -> FrozenSet[str]:
         """Tokenize a name into searchable terms."""
-        # Remove file extension
-        name = Path(name).stem
-
-        # Split on underscores and camelCase
-        tokens = re.split(r'[_]+|[A-Z][a-z]*', name)
-
-        # Filter and clean tokens
-        clean_tokens = set()
-        for token in tokens:
-            token = token.lower().strip()
-            if len(token) > 2:  # Skip very short tokens
-                clean_tokens.add(token)
-
-        return clean_tokens
+        return _name_tokens(name)
 
     def query(self, query_string: str, max_results: int = 10) -> List[QueryResult]:
         """
@@ -149,20 +159,27 @@ class SemanticQueryEngine:
         query_terms = self._tokenize_query(query_string)
         logger.debug(f"Query terms: {query_terms}")
 
-        # Score all entities
-        scored_results = []
+        # Score the entities sharing at least one term with the query (no
+        # other entity can be relevant), in index order so ties keep it
+        candidates = set().union(*(self.term_to_entities.get(term, ()) for term in query_terms))
+        entities = self.index.entities
+        scored = []
 
-        for entity_key, entity in self.index.entities.items():
-            relevance = self._calculate_entity_relevance(entity, query_terms)
+        for entity_key in sorted(candidates, key=self._entity_positions.__getitem__):
+            entity = entities[entity_key]
+            relevance = self._calculate_entity_relevance(entity, query_terms, entity_key)
             if relevance > 0.0:
-                result = self._build_query_result(entity_key, entity, relevance, query_terms)
-                scored_results.append(result)
+                scored.append((relevance, entity_key, entity))
 
-        # Sort by relevance score (descending)
-        scored_results.sort(key=lambda r: r.relevance_score, reverse=True)
+        # Top max_results by relevance score (descending; ties keep index
+        # order), in O(n log k) rather than sorting every match
+        top = heapq.nlargest(max_results, scored, key=itemgetter(0))
 
-        # Limit results
-        results = scored_results[:max_results]
+        # Build results (reasoning included) for those only
+        results = [
+            self._build_query_result(entity_key, entity, relevance, query_terms)
+            for relevance, entity_key, entity in top
+        ]
 
         logger.info(f"Query returned {len(results)} results")
         return results
@@ -177,41 +194,45 @@ class SemanticQueryEngine:
             # Remove punctuation
             token = re.sub(r'[^\w]', '', token)
             if len(token) > 2:
-                clean_tokens.add(token)
+                clean_tokens.add(sys.intern(token))
 
         return clean_tokens
 
-    def _calculate_entity_relevance(self, entity: SemanticEntity, query_terms: Set[str]) -> float:
-        """Calculate how relevant an entity is to the query."""
-        entity_terms = self.entity_search_terms.get(f"{entity.file_path}::{entity.name}", set())
+    def _calculate_entity_relevance(self, entity: SemanticEntity, query_terms: Set[str],
+                                    entity_key: Optional[str] = None) -> float:
+        """
+        Calculate how relevant an entity is to the query.
 
-        # Calculate term overlap
-        matching_terms = entity_terms.intersection(query_terms)
-        if not matching_terms:
+        entity_key is the entity's key in the index; query() passes it so
+        the key is not rebuilt per candidate (derived when None).
+        """
+        if entity_key is None:
+            entity_key = f"{entity.file_path}::{entity.name}"
+        entity_terms = self.entity_search_terms.get(entity_key, frozenset())
+
+        # Count the term overlap; the matching terms themselves are only
+        # needed for the reasoning of returned results
+        overlap = sum(1 for term in query_terms if term in entity_terms)
+        if not overlap:
             return 0.0
 
         # Base relevance from term matches
-        term_relevance = len(matching_terms) / len(query_terms)
+        term_relevance = overlap / len(query_terms)
+
+        features = self._entity_features.get(entity_key)
+        if features is None:
+            features = _relevance_features(entity)
+        name_lower, primary_tag_lower, accounting_boost, quality_boost = features
 
         # Boost for exact matches in name
-        name_lower = entity.name.lower()
         if any(term in name_lower for term in query_terms):
             term_relevance += 0.3
 
         # Boost for domain relevance
-        domain_boost = 0.0
-        if entity.domain_context.is_accounting_related:
-            domain_boost += 0.2
-        if entity.domain_context.primary_tag and any(term in entity.domain_context.primary_tag.lower() for term in query_terms):
+        domain_boost = accounting_boost
+        if primary_tag_lower and any(term in primary_tag_lower for term in query_terms):
             domain_boost += 0.3
 
-        # Boost for quality
-        quality_boost = 0.0
-        if entity.context_score.overall_score.value == "HIGH":
-            quality_boost += 0.1
-        elif entity.context_score.overall_score.value == "MEDIUM":
-            quality_boost += 0.05
-
         total_relevance = min(term_relevance + domain_boost + quality_boost, 1.0)
         return total_relevance
 
@@ -222,7 +243,7 @@ class SemanticQueryEngine:
         domain_tags = [tag.tag for tag in entity.domain_context.tags]
 
         # Get context score
-        context_score = entity.context_score.overall_score.value
+        context_score = entity.context_score.overall_score._value_
 
         # Build short context
         short_context = None
@@ -231,7 +252,7 @@ class SemanticQueryEngine:
 
         # Build reasoning
         reasoning = []
-        entity_terms = self.entity_search_terms.get(entity_key, set())
+        entity_terms = self.entity_search_terms.get(entity_key, frozenset())
         matching_terms = entity_terms.intersection(query_terms)
         if matching_terms:
             reasoning.append(f"Matches query terms: {', '.join(matching_terms)}")
@@ -239,7 +260,7 @@ class SemanticQueryEngine:
         if entity.domain_context.is_accounting_related:
             reasoning.append("Identified as accounting-related code")
 
-        if entity.context_score.overall_score.value == "HIGH":
+        if entity.context_score.overall_score._value_ == "HIGH":
             reasoning.append("High-quality, well-documented code")
 
         return QueryResult(
@@ -253,6 +274,52 @@ class SemanticQueryEngine:
         )
 
 
+@lru_cache(maxsize=16384)
+def _name_tokens(name: str) -> FrozenSet[str]:
+    """
+    Lowercased snake_case/camelCase parts of a name, minus any extension.
+
+    Memoized: names like __init__ recur across files and indexes.
+    """
+    # Remove file extension
+    stem = Path(name).stem
+
+    # Skip very short tokens
+    return frozenset(
+        sys.intern(token.lower()) for token in _NAME_TOKEN_RE.findall(stem) if len(token) > 2
+    )
+
+
+def _relevance_features(entity: SemanticEntity) -> Tuple[str, Optional[str], float, float]:
+    """
+    Query-independent relevance inputs of an entity.
+
+    Returns:
+        (lowercased name, lowercased primary tag or None,
+         accounting boost, quality boost)
+    """
+    primary_tag = entity.domain_context.primary_tag
+
+    # Boost for accounting-related code
+    accounting_boost = 0.2 if entity.domain_context.is_accounting_related else 0.0
+
+    # Boost for quality
+    overall_score = entity.context_score.overall_score._value_
+    if overall_score == "HIGH":
+        quality_boost = 0.1
+    elif overall_score == "MEDIUM":
+        quality_boost = 0.05
+    else:
+        quality_boost = 0.0
+
+    return (
+        entity.name.lower(),
+        primary_tag.lower() if primary_tag else None,
+        accounting_boost,
+        quality_boost,
+    )
+
+
 def query_semantic_index(query: str, semantic_index: SemanticIndex, max_results: int = 10) -> List[QueryResult]:
     """
     Convenience function to query a semantic index.
@@ -0,0 +1,34 @@
+"""
+Shared text preprocessing for entity names and docstrings.
+
+Design:
+- The context scorer and domain tagger both lowercase and tokenize the same
+  entity names and docstrings (and names like __init__ recur across files)
+- Each distinct string is processed once; results are memoized per text
+- Pure functions on str, so frozen entities need no extra attributes
+"""
+
+import re
+from functools import lru_cache
+
+# Runs of word characters, i.e. the spans between \b boundaries
+_WORD_RE = re.compile(r"\w+")
+
+
+@lru_cache(maxsize=16384)
+def lower_text(text: str) -> str:
+    """Return text.lower(), computed once per distinct text."""
+    return text.lower()
+
+
+@lru_cache(maxsize=16384)
+def word_set(text: str) -> frozenset:
+    """Return the set of lowercased \\w+ runs (whole words) in text."""
+    return frozenset(_WORD_RE.findall(lower_text(text)))
+
+
+@lru_cache(maxsize=16384)
+def keyword_count(text: str, keywords: tuple) -> int:
+    """Return how many of keywords occur as substrings of lower_text(text)."""
+    text_lower = lower_text(text)
+    return len([kw for kw in keywords if kw in text_lower])
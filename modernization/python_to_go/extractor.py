@@ -6,7 +6,22 @@ Extracts function metadata from Python source files for migration purposes.
 
 import ast
 import inspect
-from typing import Dict, Any, Optional
+import os
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
+
+
+@lru_cache(maxsize=256)
+def _parse_cached(file_path: str, mtime_ns: int, size: int) -> Tuple[str, ast.Module]:
+    """
+    Read and parse a Python file once per (path, mtime, size) key.
+
+    Returns:
+        Tuple of (source_code, tree); callers must not mutate the tree.
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        source_code = f.read()
+    return source_code, ast.parse(source_code, filename=file_path)
 
 
 class FunctionExtractor:
@@ -23,10 +38,8 @@ class FunctionExtractor:
         Returns:
             Dictionary containing function metadata
         """
-        with open(file_path, 'r', encoding='utf-8') as f:
-            source_code = f.read()
-
-        tree = ast.parse(source_code)
+        stat = os.stat(file_path)
+        source_code, tree = _parse_cached(os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
 
         for node in ast.walk(tree):
             if isinstance(node, ast.FunctionDef) and node.name == function_name:
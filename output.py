@@ -1,18 +1,42 @@
 import json
 import os
 
+try:
+    import orjson  # Optional: faster JSON encoding
+except ImportError:
+    orjson = None
 
-def save_json(data, filename="output/result.json"):
+
+def save_json(data, filename="output/result.json", text=None):
     """
     Saves analysis result to a JSON file
+
+    If text is given it must be the already-serialized JSON for data and is
+    written as-is, so callers that also print the JSON encode it only once.
+    Otherwise orjson is used when installed, writing its bytes directly.
     """
     # Create directory if needed, but only if filename has a directory component
     dir_path = os.path.dirname(filename)
     if dir_path:
         os.makedirs(dir_path, exist_ok=True)
 
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    encoded = None
+    if text is None and orjson is not None:
+        try:
+            encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass  # e.g. non-str keys: let the stdlib encoder handle it
+
+    if encoded is not None:
+        with open(filename, "wb") as f:
+            f.write(encoded)
+    else:
+        with open(filename, "w", encoding="utf-8") as f:
+            if text is None:
+                # ensure_ascii=False: same file content as the orjson path
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            else:
+                f.write(text)
 
     print(f"✓ Output saved to {filename}")
 
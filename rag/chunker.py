@@ -2,6 +2,9 @@
 Chunker module for converting analysis results into text chunks.
 """
 
+from core.models import Class, Function, Import
+
+
 def create_chunks(analysis_result):
     """
     Convert analysis result into text chunks for embedding.
@@ -37,3 +40,55 @@ def create_chunks(analysis_result):
         chunks.append(cls_chunk)
     
     return chunks if chunks else ["No code entities found in analysis"]
+
+
+def create_chunks_from_analysis(file_analysis):
+    """
+    Convert a FileAnalysis directly into text chunks for embedding.
+
+    Produces the same chunks as create_chunks() without first converting
+    the analysis to the legacy dict format.
+
+    Args:
+        file_analysis (FileAnalysis): Result from core.ast_parser.SafeParser.
+
+    Returns:
+        list: List of text chunks suitable for embedding.
+    """
+    # Split entities in one pass (the FileAnalysis properties each rescan them)
+    imports = []
+    functions = []
+    classes = []
+    for entity in file_analysis.entities:
+        if isinstance(entity, Function):
+            functions.append(entity)
+        elif isinstance(entity, Class):
+            classes.append(entity)
+        elif isinstance(entity, Import):
+            if entity.module:
+                imports.append(entity.module)
+
+    chunks = []
+
+    # Chunk for imports
+    if imports:
+        chunks.append("Imports: " + ", ".join(imports))
+
+    # Group call targets by caller
+    callees_by_source = {}
+    for rel in file_analysis.relationships:
+        callees_by_source.setdefault(rel.source, []).append(rel.target)
+
+    # Chunks for functions
+    for func in functions:
+        func_chunk = f"Function: {func.name} at line {func.location.line_start}"
+        if func.name in callees_by_source:
+            func_chunk += f". Calls: {', '.join(callees_by_source[func.name])}"
+        chunks.append(func_chunk)
+
+    # Chunks for classes
+    for cls in classes:
+        cls_chunk = f"Class: {cls.name} at line {cls.location.line_start}"
+        chunks.append(cls_chunk)
+
+    return chunks if chunks else ["No code entities found in analysis"]
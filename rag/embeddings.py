@@ -2,26 +2,75 @@
 Embeddings module for generating vector embeddings using HuggingFace sentence-transformers.
 """
 
+from functools import lru_cache
+
+import torch
 from sentence_transformers import SentenceTransformer
 
+from utils.config import Config
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
 MODEL_NAME = "all-MiniLM-L6-v2"
 
+@lru_cache(maxsize=1)
 def load_model():
-    """Load the sentence transformer model."""
-    return SentenceTransformer(MODEL_NAME)
+    """
+    Load the sentence transformer model (once per process).
+
+    Sequences keep the model's own length limit unless MAX_CHUNK_TOKENS is
+    set. On CUDA the weights are cast to FP16. With EMBED_COMPILE enabled the
+    transformer is also compiled with torch.compile and warmed up on a full
+    (batch size, max length) batch; chunks are padded per batch, so other
+    shapes can still recompile, which is why compiling is opt-in.
+    """
+    model = SentenceTransformer(MODEL_NAME)
+    max_tokens = Config.max_chunk_tokens()
+    if max_tokens is not None:
+        model.max_seq_length = max_tokens
+    if torch.cuda.is_available():
+        model = model.half()
+        if Config.embed_compile() and hasattr(torch, "compile"):
+            _compile_model(model)
+    return model
+
+def _compile_model(model):
+    """Compile the underlying transformer in place, reverting on failure."""
+    transformer = model[0]
+    original = transformer.auto_model
+    try:
+        transformer.auto_model = torch.compile(original, mode="reduce-overhead")
+        # Warm up at the largest shape encode produces (a full batch of
+        # max-length sequences), so compilation happens here
+        batch_size = Config.embed_batch_size()
+        warmup = ["warmup " * model.max_seq_length] * batch_size
+        model.encode(warmup, batch_size=batch_size, show_progress_bar=False, convert_to_numpy=True)
+    except Exception as e:
+        logger.warning(f"torch.compile failed, using eager model: {e}")
+        transformer.auto_model = original
 
 def generate_embeddings(chunks, model=None):
     """
     Generate embeddings for a list of text chunks.
 
+    All chunks are encoded in batched calls and L2-normalized by the model,
+    so the vectors are ready for inner-product (cosine) search.
+
     Args:
         chunks (list): List of text strings.
         model: Pre-loaded model, or None to load here.
 
     Returns:
-        list: List of numpy arrays (embeddings).
+        np.ndarray: Normalized embeddings, one row per chunk.
     """
     if model is None:
         model = load_model()
-    embeddings = model.encode(chunks, convert_to_numpy=True)
+    embeddings = model.encode(
+        chunks,
+        batch_size=Config.embed_batch_size(),
+        show_progress_bar=False,
+        convert_to_numpy=True,
+        normalize_embeddings=True,
+    )
     return embeddings
@@ -2,30 +2,90 @@
 FAISS index module for storing and loading embeddings.
 """
 
+import math
 import pickle
 import numpy as np
 import faiss
 
+from utils.config import Config
+
 INDEX_FILE = "rag/index.faiss"
 CHUNKS_FILE = "rag/chunks.pkl"
 
+# Config.embed_quantization() value -> FAISS scalar quantizer type
+_QUANTIZER_TYPES = {
+    "fp16": faiss.ScalarQuantizer.QT_fp16,
+    "int8": faiss.ScalarQuantizer.QT_8bit,
+}
+
+# Above this many vectors, quantized indexes use IVF partitioning
+IVF_THRESHOLD = 100_000
+
+# Shared GPU resources, created on first use (GPU builds of FAISS only)
+_gpu_resources = None
+
+
+def _num_gpus():
+    """Return the number of GPUs visible to FAISS (0 for faiss-cpu builds)."""
+    get_num_gpus = getattr(faiss, "get_num_gpus", None)
+    return get_num_gpus() if get_num_gpus else 0
+
+
+def _create_index(dimension, num_vectors):
+    """
+    Create an inner-product index for the configured quantization.
+
+    Unquantized (flat) indexes are placed on GPU 0 when one is available.
+    Quantized indexes store fp16/int8 codes and stay on CPU; above
+    IVF_THRESHOLD vectors they are IVF-partitioned.
+
+    Returns:
+        tuple: (index, on_gpu)
+    """
+    global _gpu_resources
+    qtype = _QUANTIZER_TYPES.get(Config.embed_quantization())
+
+    if qtype is not None:
+        if num_vectors > IVF_THRESHOLD:
+            nlist = int(4 * math.sqrt(num_vectors))
+            quantizer = faiss.IndexFlatIP(dimension)
+            index = faiss.IndexIVFScalarQuantizer(
+                quantizer, dimension, nlist, qtype, faiss.METRIC_INNER_PRODUCT
+            )
+            index.nprobe = 16
+        else:
+            index = faiss.IndexScalarQuantizer(dimension, qtype, faiss.METRIC_INNER_PRODUCT)
+        return index, False
+
+    index = faiss.IndexFlatIP(dimension)  # Inner product for cosine
+    if _num_gpus() > 0:
+        if _gpu_resources is None:
+            _gpu_resources = faiss.StandardGpuResources()
+        return faiss.index_cpu_to_gpu(_gpu_resources, 0, index), True
+    return index, False
+
 def build_and_save_index(chunks, embeddings):
     """
     Build FAISS index from embeddings and save to disk.
 
     Args:
         chunks (list): List of text chunks.
-        embeddings (np.array): Embeddings array.
+        embeddings (np.array): Embeddings array, already L2-normalized by
+            generate_embeddings().
     """
-    # Normalize embeddings for cosine similarity
-    faiss.normalize_L2(embeddings)
+    # FAISS requires contiguous float32 input (FP16 models may return float16)
+    embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
 
     # Create index
     dimension = embeddings.shape[1]
-    index = faiss.IndexFlatIP(dimension)  # Inner product for cosine
+    index, on_gpu = _create_index(dimension, len(embeddings))
+    if not index.is_trained:
+        index.train(embeddings)
     index.add(embeddings)
 
-    # Save index and chunks
+    # Save index and chunks (GPU indexes are copied back only for writing)
+    if on_gpu:
+        index = faiss.index_gpu_to_cpu(index)
     faiss.write_index(index, INDEX_FILE)
     with open(CHUNKS_FILE, "wb") as f:
         pickle.dump(chunks, f)
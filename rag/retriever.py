@@ -3,7 +3,6 @@ Retriever module for fetching relevant chunks based on query.
 """
 
 import numpy as np
-import faiss
 from .embeddings import generate_embeddings, load_model
 from .faiss_index import load_index
 
@@ -18,16 +17,17 @@ def retrieve(query, top_k=5):
     Returns:
         list: List of retrieved text chunks.
     """
-    # Load model and generate query embedding
+    # Load model (cached after the first query) and generate query embedding
     model = load_model()
     query_embedding = generate_embeddings([query], model)[0]
-    query_embedding = np.expand_dims(query_embedding, axis=0)
-    faiss.normalize_L2(query_embedding)
+    # Embeddings come back L2-normalized; FAISS needs a float32 row
+    query_embedding = np.expand_dims(query_embedding, axis=0).astype(np.float32)
 
     # Load index and search
     index, chunks = load_index()
     distances, indices = index.search(query_embedding, top_k)
 
-    # Retrieve chunks
-    retrieved = [chunks[i] for i in indices[0] if i < len(chunks)]
+    # Retrieve chunks. FAISS pads with -1 when fewer than top_k vectors are
+    # found (e.g. IVF probing a few sparse lists)
+    retrieved = [chunks[i] for i in indices[0] if 0 <= i < len(chunks)]
     return retrieved
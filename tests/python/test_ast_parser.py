@@ -0,0 +1,43 @@
+"""
+Tests for ast_parser helpers that reimplement stdlib behaviour.
+
+_get_docstring must agree with ast.get_docstring on every Python version,
+including the first-line whitespace inspect.cleandoc strips.
+"""
+
+import ast
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from core.ast_parser import _get_docstring
+
+
+# Whitespace str.lstrip() removes; cleandoc only strips spaces since 3.13
+LEADING = [" ", "\t", "\f", "\v", "\r", "\xa0", "　", " ", "\x85", ""]
+
+
+def function_with_docstring(text: str) -> ast.FunctionDef:
+    return ast.parse(f"def f():\n    {text!r}\n").body[0]
+
+
+class TestGetDocstring(unittest.TestCase):
+
+    def test_matches_ast_get_docstring(self):
+        for first in LEADING:
+            for second in LEADING:
+                for body in ["Post an entry.", "", "  padded  ", "\tTabbed.\t", "Two\n  lines."]:
+                    text = first + second + body
+                    with self.subTest(text=text):
+                        node = function_with_docstring(text)
+                        self.assertEqual(_get_docstring(node), ast.get_docstring(node) or "")
+
+    def test_no_docstring(self):
+        node = ast.parse("def f():\n    return 1\n").body[0]
+        self.assertEqual(_get_docstring(node), "")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+Tests for the chunks analyzer.index_project embeds.
+
+Chunks must name the file they came from, so same-named entities in
+different files stay distinguishable.
+"""
+
+import os
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from core.project_analyzer import ProjectAnalyzer
+
+try:
+    import analyzer
+except ImportError:  # CLI dependencies (python-dotenv) not installed
+    analyzer = None
+
+
+SOURCE = textwrap.dedent('''
+    import os
+
+
+    def main():
+        return helper()
+
+
+    def helper():
+        return os.getcwd()
+''')
+
+
+@unittest.skipIf(analyzer is None, "analyzer CLI dependencies not installed")
+class TestChunkProjectFiles(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        (self.root / "pkg").mkdir()
+        (self.root / "app.py").write_text(SOURCE, encoding="utf-8")
+        (self.root / "pkg" / "tool.py").write_text(SOURCE, encoding="utf-8")
+        (self.root / "pkg" / "broken.py").write_text("def (:\n", encoding="utf-8")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def chunks(self, workers=""):
+        project = ProjectAnalyzer(str(self.root))
+        with patch.dict(os.environ, {"PARSE_WORKERS": workers, "PARSE_CACHE_DIR": ""}):
+            return analyzer._chunk_project_files(project, project.collect_python_files())
+
+    def test_chunks_are_prefixed_with_relative_path(self):
+        chunks = self.chunks()
+        tool = os.path.join("pkg", "tool.py")
+
+        self.assertIn("File: app.py. Function: main at line 5. Calls: helper", chunks)
+        self.assertIn(f"File: {tool}. Function: main at line 5. Calls: helper", chunks)
+        self.assertIn("File: app.py. Imports: os", chunks)
+        self.assertEqual(len(chunks), 6)
+
+    def test_unparseable_files_contribute_no_chunks(self):
+        self.assertFalse(any("broken.py" in chunk for chunk in self.chunks()))
+
+    def test_pooled_parsing_matches_serial(self):
+        self.assertEqual(self.chunks("2"), self.chunks("1"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+"""
+Tests for the cached entity views on FileAnalysis and ProjectAnalysis.
+
+The caches must follow entities lists that are replaced, including by a
+new list of the same length that may reuse a freed list's id().
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from core.models import (
+    Class, EntityType, FileAnalysis, Function, Location, ProjectAnalysis,
+)
+
+
+def function(name: str) -> Function:
+    return Function(name, EntityType.FUNCTION, Location("sample.py", 1))
+
+
+def klass(name: str) -> Class:
+    return Class(name, EntityType.CLASS, Location("sample.py", 1))
+
+
+class TestFileAnalysisViews(unittest.TestCase):
+
+    def test_views_follow_reassigned_entities(self):
+        fa = FileAnalysis("sample.py", entities=[function("post")])
+        self.assertEqual([f.name for f in fa.functions], ["post"])
+        self.assertEqual(fa.entity_name_set, {"post"})
+
+        # Replace the list twice: the second list may reuse the first's id
+        fa.entities = [function("validate")]
+        fa.entities = [klass("Invoice")]
+        self.assertEqual(fa.functions, [])
+        self.assertEqual([c.name for c in fa.classes], ["Invoice"])
+        self.assertEqual(fa.entity_name_set, {"Invoice"})
+
+    def test_views_follow_appended_entities(self):
+        fa = FileAnalysis("sample.py", entities=[function("post")])
+        self.assertEqual(len(fa.functions), 1)
+        fa.entities.append(function("validate"))
+        self.assertEqual([f.name for f in fa.functions], ["post", "validate"])
+
+
+class TestProjectAnalysisViews(unittest.TestCase):
+
+    def test_views_follow_reassigned_file_entities(self):
+        fa = FileAnalysis("sample.py", entities=[function("post")])
+        project = ProjectAnalysis("sample", file_analyses=[fa])
+        self.assertEqual([f.name for f in project.all_functions], ["post"])
+
+        # Same entity count, different list
+        fa.entities = [klass("Invoice")]
+        self.assertEqual(project.all_functions, [])
+        self.assertEqual([c.name for c in project.all_classes], ["Invoice"])
+
+    def test_views_follow_reassigned_file_analyses(self):
+        project = ProjectAnalysis("sample", file_analyses=[
+            FileAnalysis("a.py", entities=[function("post")]),
+        ])
+        self.assertEqual(len(project.all_entities), 1)
+
+        project.file_analyses = [FileAnalysis("b.py", entities=[klass("Invoice")])]
+        project.file_analyses = [FileAnalysis("c.py", entities=[function("close")])]
+        self.assertEqual([e.name for e in project.all_entities], ["close"])
+
+
+if __name__ == '__main__':
+    unittest.main()
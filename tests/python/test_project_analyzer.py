@@ -0,0 +1,189 @@
+"""
+Tests for ProjectAnalyzer cross-file relationships and file parsing.
+
+Edges must point at the file that defines a name, never at files that
+merely import it, and a definition in the calling file shadows the rest.
+Parsing is serial unless PARSE_WORKERS asks for a pool, and a broken
+pool must not abort the analysis. Files skipped as too large are reported
+as project errors.
+"""
+
+import os
+import sys
+import tempfile
+import textwrap
+import unittest
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from core.project_analyzer import ProjectAnalyzer
+
+
+# Mirrors the stdlib email package: charset.py defines Charset, mime/text.py
+# imports it and calls it, and utils.py imports it without defining it
+FILES = {
+    "charset.py": '''
+        class Charset:
+            def __init__(self, name):
+                self.name = name
+    ''',
+    "mime/text.py": '''
+        from email.charset import Charset
+
+
+        def set_payload(payload, charset):
+            return Charset(charset)
+    ''',
+    "utils.py": '''
+        from email.charset import Charset
+
+
+        def formataddr(pair, charset="utf-8"):
+            return Charset(charset)
+    ''',
+    "local.py": '''
+        def normalize(value):
+            return value
+
+
+        def run(value):
+            return normalize(value)
+    ''',
+    "other.py": '''
+        def normalize(value):
+            return value.strip()
+    ''',
+    "caller.py": '''
+        def main():
+            return normalize(" x ")
+    ''',
+}
+
+
+class TestCrossFileRelationships(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name).resolve()
+        for rel_path, source in FILES.items():
+            path = self.root / rel_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(textwrap.dedent(source), encoding="utf-8")
+        analysis = ProjectAnalyzer(str(self.root), "sample").analyze_project()
+        self.edges = [
+            (self.rel(r.source), self.rel(r.target))
+            for r in analysis.all_relationships
+        ]
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def rel(self, node):
+        file_path, name = node.split("::", 1)
+        return f"{Path(file_path).relative_to(self.root).as_posix()}::{name}"
+
+    def targets_from(self, file_name):
+        return sorted(t for s, t in self.edges if s.startswith(file_name + "::"))
+
+    def test_edge_points_at_defining_file(self):
+        self.assertEqual(self.targets_from("mime/text.py"), ["charset.py::Charset"])
+        self.assertEqual(self.targets_from("utils.py"), ["charset.py::Charset"])
+
+    def test_importing_file_is_never_a_target(self):
+        targets = {t for _, t in self.edges}
+        self.assertNotIn("mime/text.py::Charset", targets)
+        self.assertNotIn("utils.py::Charset", targets)
+
+    def test_local_definition_shadows_other_files(self):
+        self.assertEqual(self.targets_from("local.py"), [])
+
+    def test_one_edge_per_defining_file(self):
+        self.assertEqual(
+            self.targets_from("caller.py"),
+            ["local.py::normalize", "other.py::normalize"],
+        )
+
+
+class BrokenPool:
+    """ProcessPoolExecutor stand-in whose pool dies after one result."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def map(self, fn, items, chunksize=1):
+        items = iter(items)
+        yield fn(next(items))
+        raise BrokenProcessPool("A child process terminated abruptly")
+
+
+class TestParseWorkers(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        for rel_path, source in FILES.items():
+            path = self.root / rel_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(textwrap.dedent(source), encoding="utf-8")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def analyze(self, workers):
+        with patch.dict(os.environ, {"PARSE_WORKERS": workers, "PARSE_CACHE_DIR": ""}):
+            return ProjectAnalyzer(str(self.root), "sample").analyze_project()
+
+    def test_serial_by_default(self):
+        with patch("concurrent.futures.ProcessPoolExecutor") as pool:
+            analysis = self.analyze("")
+        pool.assert_not_called()
+        self.assertEqual(len(analysis.file_analyses), len(FILES))
+
+    def test_broken_pool_falls_back_to_serial(self):
+        serial = self.analyze("")
+        with patch("concurrent.futures.ProcessPoolExecutor", BrokenPool):
+            pooled = self.analyze("2")
+
+        self.assertEqual(pooled.errors, [])
+        self.assertEqual(
+            [fa.file_path for fa in pooled.file_analyses],
+            [fa.file_path for fa in serial.file_analyses],
+        )
+        self.assertEqual(pooled.all_relationships, serial.all_relationships)
+
+
+class TestOversizedFiles(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name).resolve()
+        (self.root / "big.py").write_text("def post():\n    pass\n", encoding="utf-8")
+        (self.root / "empty.py").write_text("", encoding="utf-8")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_skipped_files_are_project_errors(self):
+        # 0 MB: every non-empty file is over the limit
+        with patch.dict(os.environ, {"MAX_FILE_SIZE_MB": "0", "PARSE_CACHE_DIR": ""}):
+            analysis = ProjectAnalyzer(str(self.root), "sample").analyze_project()
+
+        self.assertEqual(
+            [Path(fa.file_path).name for fa in analysis.file_analyses], ["empty.py"]
+        )
+        self.assertEqual(len(analysis.errors), 1)
+        self.assertIn(str(self.root / "big.py"), analysis.errors[0])
+        self.assertIn("exceeds maximum size (0 MB)", analysis.errors[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,215 @@
+"""
+Tests for semantic index persistence (save_index / load_index).
+
+Covers the JSON round-trip and the opt-in pickle sidecar, including
+sidecars that no longer match their JSON, and serial vs pooled builds.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from core.project_analyzer import ProjectAnalyzer
+from core import semantic_index
+from core.domain_tagger import DomainTagger
+from core.semantic_index import SemanticIndexer
+
+
+SOURCE = textwrap.dedent('''
+    """Ledger posting helpers."""
+
+
+    def post_ledger_entry(entry):
+        """Post a journal entry to the general ledger (debit and credit)."""
+        return validate_entry(entry)
+
+
+    def validate_entry(entry):
+        """Validate a journal entry."""
+        return entry
+
+
+    class InvoiceBuilder:
+        """Build sales invoices."""
+
+        def build(self):
+            return post_ledger_entry({})
+
+
+    def validate_entry(entry):  # Redefined: same index key as the first one
+        """Validate a journal entry (debit equals credit)."""
+        return entry
+''')
+
+
+def build_index(root: Path, project_name: str = "sample"):
+    """Analyze root and build its semantic index."""
+    analysis = ProjectAnalyzer(str(root), project_name).analyze_project()
+    return SemanticIndexer().build_index(analysis)
+
+
+class TestSemanticIndexPersistence(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        (self.tmp / "src").mkdir()
+        (self.tmp / "src" / "ledger.py").write_text(SOURCE, encoding="utf-8")
+        self.json_path = self.tmp / "index.json"
+        self.sidecar = self.json_path.with_suffix(".semidx.pkl")
+        semantic_index._load_index_cached.cache_clear()
+
+    def tearDown(self):
+        semantic_index._load_index_cached.cache_clear()
+        self._tmp.cleanup()
+
+    def load(self):
+        semantic_index._load_index_cached.cache_clear()
+        return SemanticIndexer().load_index(str(self.json_path))
+
+    def test_json_round_trip(self):
+        index = build_index(self.tmp / "src")
+        with patch.dict(os.environ, {"SEMANTIC_INDEX_PICKLE": "false"}):
+            SemanticIndexer().save_index(index, str(self.json_path))
+            loaded = self.load()
+
+        self.assertFalse(self.sidecar.exists())
+        self.assertEqual(loaded, index)
+
+    def test_saved_json_matches_to_dict(self):
+        index = build_index(self.tmp / "src")
+        SemanticIndexer().save_index(index, str(self.json_path))
+
+        expected = json.dumps(index.to_dict(), indent=2, ensure_ascii=False)
+        self.assertEqual(self.json_path.read_text(encoding="utf-8"), expected)
+
+    def test_pickle_sidecar_round_trip(self):
+        index = build_index(self.tmp / "src")
+        with patch.dict(os.environ, {"SEMANTIC_INDEX_PICKLE": "true"}):
+            SemanticIndexer().save_index(index, str(self.json_path))
+            loaded = self.load()
+
+        self.assertTrue(self.sidecar.exists())
+        self.assertEqual(loaded, index)
+
+    def test_pickle_and_json_loads_are_equal(self):
+        index = build_index(self.tmp / "src")
+        with patch.dict(os.environ, {"SEMANTIC_INDEX_PICKLE": "true"}):
+            SemanticIndexer().save_index(index, str(self.json_path))
+            from_pickle = self.load()
+        with patch.dict(os.environ, {"SEMANTIC_INDEX_PICKLE": "false"}):
+            from_json = self.load()
+
+        self.assertEqual(from_pickle, from_json)
+        self.assertEqual(from_pickle.to_json_bytes(), from_json.to_json_bytes())
+        ledger = next(iter(from_json.files.values()))
+        self.assertEqual([e.name for e in ledger.entities].count("validate_entry"), 2)
+
+    def test_sidecar_ignored_when_disabled(self):
+        index = build_index(self.tmp / "src")
+        with patch.dict(os.environ, {"SEMANTIC_INDEX_PICKLE": "true"}):
+            SemanticIndexer().save_index(index, str(self.json_path))
+
+        with patch.dict(os.environ, {"SEMANTIC_INDEX_PICKLE": "false"}), \
+                patch.object(semantic_index.pickle, "load") as pickle_load:
+            loaded = self.load()
+        pickle_load.assert_not_called()
+        self.assertEqual(loaded, index)
+
+    def test_stale_sidecar_is_ignored(self):
+        old = build_index(self.tmp / "src", "old")
+        with patch.dict(os.environ, {"SEMANTIC_INDEX_PICKLE": "true"}):
+            SemanticIndexer().save_index(old, str(self.json_path))
+        old_mtime = os.stat(self.json_path).st_mtime_ns
+
+        # Rewrite the JSON only, then restore its old mtime (as cp -p would):
+        # the sidecar still predates it and must lose
+        new = build_index(self.tmp / "src", "renamed project")
+        with patch.dict(os.environ, {"SEMANTIC_INDEX_PICKLE": "false"}):
+            SemanticIndexer().save_index(new, str(self.json_path))
+        os.utime(self.json_path, ns=(old_mtime, old_mtime))
+
+        with patch.dict(os.environ, {"SEMANTIC_INDEX_PICKLE": "true"}):
+            loaded = self.load()
+        self.assertEqual(loaded.project_name, "renamed project")
+
+    def test_sidecar_from_other_version_is_ignored(self):
+        index = build_index(self.tmp / "src")
+        with patch.dict(os.environ, {"SEMANTIC_INDEX_PICKLE": "true"}):
+            SemanticIndexer().save_index(index, str(self.json_path))
+            with patch.object(semantic_index, "_PICKLE_SIDECAR_VERSION", 0), \
+                    patch.object(semantic_index, "_load_index_json",
+                                 wraps=semantic_index._load_index_json) as load_json:
+                loaded = self.load()
+
+        load_json.assert_called_once()
+        self.assertEqual(loaded, index)
+
+    def test_corrupt_sidecar_falls_back_to_json(self):
+        index = build_index(self.tmp / "src")
+        with patch.dict(os.environ, {"SEMANTIC_INDEX_PICKLE": "true"}):
+            SemanticIndexer().save_index(index, str(self.json_path))
+            self.sidecar.write_bytes(b"not a pickle")
+            loaded = self.load()
+
+        self.assertEqual(loaded, index)
+
+
+class CustomTagger(DomainTagger):
+    """Tagger override the indexer must also use in worker processes."""
+
+    def tag_entity(self, entity):
+        context = super().tag_entity(entity)
+        context.primary_tag = "custom"
+        return context
+
+
+class TestBuildIndexWorkers(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        root = Path(self._tmp.name)
+        for i in range(4):
+            (root / f"ledger_{i}.py").write_text(SOURCE, encoding="utf-8")
+        self.analysis = ProjectAnalyzer(str(root), "sample").analyze_project()
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def build(self, workers, tagger=None):
+        indexer = SemanticIndexer()
+        if tagger is not None:
+            indexer.tagger = tagger
+        with patch.dict(os.environ, {"INDEX_WORKERS": workers}):
+            return indexer.build_index(self.analysis)
+
+    def test_serial_by_default(self):
+        with patch("concurrent.futures.ProcessPoolExecutor") as pool:
+            self.build("")
+        pool.assert_not_called()
+
+    def test_pooled_build_matches_serial(self):
+        serial = self.build("")
+        pooled = self.build("2")
+        self.assertEqual(pooled, serial)
+        self.assertEqual(pooled.to_json_bytes(), serial.to_json_bytes())
+
+    def test_pool_uses_indexer_tagger(self):
+        serial = self.build("", CustomTagger())
+        pooled = self.build("2", CustomTagger())
+        self.assertEqual(pooled, serial)
+        self.assertTrue(pooled.entities)
+        self.assertTrue(all(
+            se.domain_context.primary_tag == "custom" for se in pooled.entities.values()
+        ))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,5 +4,6 @@ Shared utilities and helpers.
 This package provides cross-cutting concerns:
 - logger: Structured logging throughout the application
 - config: Centralized configuration management
+- json_encoding: Indented JSON encoding for streamed output files
 - validators: Input validation helpers
 """
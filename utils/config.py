@@ -87,6 +87,39 @@ class Config:
             "sentence-transformers/all-MiniLM-L6-v2"
         )
 
+    @classmethod
+    def embed_batch_size(cls) -> int:
+        try:
+            return int(os.getenv("EMBED_BATCH_SIZE", "64"))
+        except ValueError:
+            return 64
+
+    @classmethod
+    def max_chunk_tokens(cls) -> Optional[int]:
+        """Embedding sequence length cap (None: keep the model's own limit)."""
+        try:
+            tokens = int(os.getenv("MAX_CHUNK_TOKENS", "0"))
+        except ValueError:
+            return None
+        return tokens if tokens > 0 else None
+
+    @classmethod
+    def embed_compile(cls) -> bool:
+        """torch.compile the embedding model on CUDA (opt-in)."""
+        return os.getenv("EMBED_COMPILE", "false").lower() in ("true", "1", "yes")
+
+    @classmethod
+    def embed_quantization(cls) -> str:
+        """
+        Storage format for vectors in the FAISS index.
+
+        Supported values:
+        - none (float32, default)
+        - fp16
+        - int8
+        """
+        return os.getenv("EMBED_QUANTIZATION", "none").lower()
+
     @classmethod
     def faiss_index_path(cls) -> Path:
         return Path(
@@ -114,6 +147,34 @@ class Config:
         except ValueError:
             return 10
 
+    @classmethod
+    def parse_workers(cls) -> Optional[int]:
+        """Worker processes for project parsing (None: serial)."""
+        try:
+            workers = int(os.getenv("PARSE_WORKERS", "0"))
+        except ValueError:
+            return None
+        return workers if workers > 0 else None
+
+    @classmethod
+    def index_workers(cls) -> Optional[int]:
+        """Worker processes for semantic index tagging (None: serial)."""
+        try:
+            workers = int(os.getenv("INDEX_WORKERS", "0"))
+        except ValueError:
+            return None
+        return workers if workers > 0 else None
+
+    @classmethod
+    def semantic_index_pickle(cls) -> bool:
+        """Write/read a pickle sidecar next to saved semantic indexes."""
+        return os.getenv("SEMANTIC_INDEX_PICKLE", "false").lower() in ("true", "1", "yes")
+
+    @classmethod
+    def parse_cache_dir(cls) -> Optional[str]:
+        """Directory for cached parse results (None: caching disabled)."""
+        return os.getenv("PARSE_CACHE_DIR") or None
+
     @classmethod
     def ignore_patterns(cls) -> list[str]:
         default = "__pycache__,.git,venv,env,.venv,.pytest_cache,.tox,*.egg-info,node_modules"
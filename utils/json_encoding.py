@@ -0,0 +1,58 @@
+"""
+Indented JSON encoding for streamed output files.
+
+Design Rationale:
+- Saved analyses and semantic indexes are written piece by piece, so the
+  full to_dict() tree is never built in memory
+- Every piece is encoded exactly as json.dump(indent=2, ensure_ascii=False)
+  would encode it at its nesting depth, so streamed files are
+  byte-identical to dumping the whole dict
+- orjson is used when installed (optional dependency), stdlib otherwise
+- Dataclass instances encode as their fields in declaration order
+  (orjson does this natively; the stdlib path mirrors it)
+"""
+
+import json
+from dataclasses import fields, is_dataclass
+from typing import Any, Dict
+
+try:
+    import orjson  # Optional: faster JSON encoding
+except ImportError:
+    orjson = None
+
+
+def encode_json(data: Any, level: int = 0) -> bytes:
+    """
+    Encode data as 2-space indented JSON, nested `level` levels deep.
+
+    Strings never contain a raw newline once encoded, so re-indenting is a
+    plain replace.
+
+    Args:
+        data: Value to encode (JSON types and dataclass instances)
+        level: Nesting depth the value is written at
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    encoded = None
+    if orjson is not None:
+        try:
+            encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass  # e.g. non-str metadata keys: let the stdlib encoder handle it
+    if encoded is None:
+        encoded = json.dumps(
+            data, indent=2, ensure_ascii=False, default=_dataclass_fields
+        ).encode("utf-8")
+    if level:
+        encoded = encoded.replace(b"\n", b"\n" + b"  " * level)
+    return encoded
+
+
+def _dataclass_fields(obj: Any) -> Dict[str, Any]:
+    """json.dumps default hook: a dataclass instance as a field dict."""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")